@@ -0,0 +1,2 @@
+# Пакет с играми. Каждый модуль игры можно импортировать без побочных эффектов:
+# окно создается только в main(). Лаунчер: python -m games
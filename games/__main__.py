@@ -0,0 +1,3 @@
+from games import launcher
+
+launcher.main()
@@ -0,0 +1,92 @@
+import os
+import time
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Общая загрузка изображений для всех игр: кэш по пути к файлу и преобразование
+# в формат экрана. Без convert()/convert_alpha() каждый вывод изображения на экран
+# преобразует пиксели заново, поэтому изображение преобразуется один раз, как только
+# создано окно. Список файлов можно заранее загрузить в фоновом потоке
+class AssetCache:
+    def __init__(self, root=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))):
+        self.root = root  # Каталог, от которого отсчитываются относительные пути (корень репозитория)
+        self.surfaces = {}  # Путь -> загруженная поверхность
+        self.masks = {}  # Путь -> маска непрозрачных пикселей для точной проверки столкновений
+        self.converted = set()  # Пути поверхностей, уже преобразованных в формат экрана
+        self.pending = {}  # Путь -> задача фоновой загрузки
+        self.executor = None
+        self.hits = 0
+        self.misses = 0
+        self.load_time = 0.0  # Суммарное время чтения файлов, с
+        self.convert_time = 0.0  # Суммарное время преобразования в формат экрана, с
+
+    def path(self, name):
+        return os.path.normpath(os.path.join(self.root, name))
+
+    def _read(self, path):
+        # Чтение файла; выполняется в основном или фоновом потоке
+        start = time.perf_counter()
+        surface = pygame.image.load(path)
+        return surface, time.perf_counter() - start
+
+    def preload(self, names, workers=2):
+        # Фоновая загрузка списка файлов (манифеста); load() дождется незавершенной загрузки.
+        # Преобразование в формат экрана выполняется позже, в основном потоке
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=workers)
+        for name in names:
+            path = self.path(name)
+            if path not in self.surfaces and path not in self.pending:
+                self.pending[path] = self.executor.submit(self._read, path)
+
+    def load(self, name):
+        # Изображение из кэша; при первом обращении загружается с диска
+        path = self.path(name)
+        surface = self.surfaces.get(path)
+        if surface is None:
+            self.misses += 1
+            task = self.pending.pop(path, None)
+            surface, elapsed = task.result() if task is not None else self._read(path)
+            self.load_time += elapsed
+            self.surfaces[path] = surface
+        else:
+            self.hits += 1
+        if path not in self.converted and pygame.display.get_surface() is not None:
+            # Формат экрана, чтобы вывод не требовал преобразования пикселей
+            start = time.perf_counter()
+            alpha = surface.get_flags() & pygame.SRCALPHA or surface.get_colorkey() is not None
+            surface = surface.convert_alpha() if alpha else surface.convert()
+            self.convert_time += time.perf_counter() - start
+            self.surfaces[path] = surface
+            self.converted.add(path)
+        return surface
+
+    def mask(self, name):
+        # Маска изображения (pygame.mask.from_surface); строится один раз для каждого файла
+        path = self.path(name)
+        mask = self.masks.get(path)
+        if mask is None:
+            mask = self.masks[path] = pygame.mask.from_surface(self.load(name))
+        return mask
+
+    def stats(self):
+        # Статистика: попадания, промахи, время загрузки и преобразования в миллисекундах
+        requests = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / requests if requests else 0.0,
+                "surfaces": len(self.surfaces), "load_ms": self.load_time * 1000,
+                "convert_ms": self.convert_time * 1000}
+
+    def clear(self):
+        # Очистка кэша (например, после смены режима экрана, когда нужен новый формат)
+        self.surfaces.clear()
+        self.converted.clear()
+        self.masks.clear()
+
+
+# Общий экземпляр, который используют все игры
+cache = AssetCache()
+load = cache.load
+mask = cache.mask
+preload = cache.preload
+stats = cache.stats
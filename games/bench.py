@@ -0,0 +1,233 @@
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+# Бенчмарки работают без окна: SDL выводит изображение в память
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+REPEATS = 5  # Количество прогонов каждого замера
+THRESHOLD = 0.10  # Допустимое замедление относительно базовых результатов (10%)
+RUNNER_COUNTS = (10, 100, 1000)  # Количество объектов для замеров Раннера
+
+
+# Время одного вызова func в микросекундах: минимум и медиана из repeats прогонов по
+# number вызовов. setup() готовит состояние перед каждым прогоном и в замер не входит;
+# batch - количество операций в одном вызове func (время делится на него)
+def measure(setup, func, number, repeats=REPEATS, batch=1):
+    samples = []
+    for _ in range(repeats):
+        state = setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func(state)
+        samples.append((time.perf_counter() - start) / (number * batch) * 1e6)
+    return {"us_min": min(samples), "us_median": statistics.median(samples), "calls": number * batch,
+            "repeats": repeats}
+
+
+# Тетрис: проверка позиций фигур, очистка линий и отрисовка для Board и BitBoard
+def tetris_cases():
+    from games import tetris
+    screen = pygame.display.set_mode((300, 600))
+    cases = {}
+    for board_cls in (tetris.Board, tetris.BitBoard):
+        name = board_cls.__name__
+
+        def played(board_cls=board_cls):
+            # Поле после нескольких фигур и все положения всех фигур в верхней половине поля
+            game = tetris.Game(screen, board_cls, random.Random(0))
+            for _ in range(12):
+                tetris.play_move(game, *tetris.lowest_policy(game))
+            probes = []
+            for shape_id in range(len(tetris.SHAPES)):
+                piece = tetris.Piece(game.board, shape_id)
+                for rotation in range(len(piece.states)):
+                    piece.set_rotation(rotation)
+                    for x in range(-1, game.board.width):
+                        for y in range(0, game.board.height - 1, 3):
+                            probe = tetris.Piece(game.board, shape_id)
+                            probe.set_rotation(rotation)
+                            probe.x, probe.y = x, y
+                            probes.append(probe)
+            return game, probes
+
+        game, probes = played()
+        coords = [probe.shape_coords() for probe in probes]
+        cases[f"tetris.{name}.is_valid_position"] = measure(
+            lambda: game.board, lambda board: [board.is_valid_position(shape) for shape in coords], 20,
+            batch=len(coords))
+        cases[f"tetris.{name}.fits"] = measure(
+            lambda: game.board, lambda board: [board.fits(probe) for probe in probes], 20, batch=len(probes))
+
+        def fill_and_clear(board):
+            # Заполнение четырех нижних строк и их очистка
+            if isinstance(board, tetris.BitBoard):
+                board.rows[-4:] = [board.full_row] * 4
+            else:
+                board.grid[-4:] = [[1] * board.width for _ in range(4)]
+            board.clear_lines()
+
+        cases[f"tetris.{name}.clear_lines"] = measure(lambda: played()[0].board, fill_and_clear, 2000)
+
+        def step_draw(game):
+            # Сдвиг фигуры и отрисовка изменившихся областей
+            if not game.piece.move(1, 0):
+                game.piece.move(-1, 0)
+            return game.draw()
+
+        def full_draw(game):
+            game.board.changed = True
+            return game.draw()
+
+        cases[f"tetris.{name}.draw"] = measure(lambda: played()[0], step_draw, 500)
+        cases[f"tetris.{name}.draw[full]"] = measure(lambda: played()[0], full_draw, 200)
+    return cases
+
+
+# Змейка: шаг змейки, проверка столкновений и обновление экрана (частичное и полное)
+def snake_cases():
+    from games import snake
+
+    def long_snake(length=30):
+        body = snake.Snake(snake.Settings())
+        for _ in range(length - 1):
+            body.grow_snake()
+            body.update()
+        return body
+
+    def game_setup():
+        game = snake.Game()
+        game.snake = long_snake()
+        game.food = snake.Food(game.settings, game.snake)
+        game._update_screen()  # Первый кадр - полная перерисовка
+        return game
+
+    def full_redraw(game):
+        game.full_redraw = True
+        game._update_screen()
+
+    return {
+        "snake.Snake.update": measure(long_snake, lambda body: body.update(), 20000),
+        "snake.Snake._check_collisions": measure(long_snake, lambda body: body._check_collisions(), 20000),
+        "snake.Game._update_screen": measure(game_setup, lambda game: game._update_screen(), 1000),
+        "snake.Game._update_screen[full]": measure(game_setup, full_redraw, 200),
+    }
+
+
+# Раннер: обновление, проверка столкновений с игроком и отрисовка при разном количестве объектов
+def runner_cases():
+    from games import runner
+    game = runner.Game(seed=0)
+    kinds = (runner.Obstacle, runner.Life, runner.Coin, runner.Diamond)
+    cases = {}
+    for count in RUNNER_COUNTS:
+        def setup(count=count):
+            game.reset()
+            game.player.lives = 10 ** 9  # Игра не заканчивается во время замера
+            rng = random.Random(0)
+            for _ in range(count):
+                game.pool.spawn(rng.choice(kinds), rng.randint(0, runner.SCREEN_WIDTH - 40),
+                                rng.randint(-runner.SCREEN_HEIGHT, runner.SCREEN_HEIGHT))
+            return game
+
+        cases[f"runner.Game.update[{count}]"] = measure(setup, lambda game: game.update(), 50)
+        cases[f"runner.Game.check_collisions[{count}]"] = measure(setup, lambda game: game.check_collisions(), 1000)
+        cases[f"runner.Game.draw[{count}]"] = measure(setup, lambda game: game.draw(), 50)
+    return cases
+
+
+# Пинг-понг: шаг физики с управлением ИИ и отрисовка
+def pingpong_cases():
+    from games import pingpong
+    screen = pygame.display.set_mode((pingpong.SCREEN_WIDTH, pingpong.SCREEN_HEIGHT))
+
+    def setup():
+        return pingpong.Game(pingpong.tracking_controller, pingpong.tracking_controller, random.Random(0))
+
+    return {
+        "pingpong.Game.update": measure(setup, lambda game: game.update(), 20000),
+        "pingpong.Game.draw": measure(setup, lambda game: game.draw(screen), 1000),
+    }
+
+
+SUITES = {"tetris": tetris_cases, "snake": snake_cases, "runner": runner_cases, "pingpong": pingpong_cases}
+
+
+# Запуск выбранных наборов (по умолчанию всех) и сбор результатов с описанием окружения
+def run(names=None):
+    pygame.init()
+    results = {}
+    for name in names or SUITES:
+        results.update(SUITES[name]())
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "video_driver": os.environ["SDL_VIDEODRIVER"],
+            "repeats": REPEATS,
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+# Сравнение с базовыми результатами по медиане: замедление больше threshold - регрессия.
+# Возвращает список строк отчета и количество регрессий
+def compare(base, new, threshold=THRESHOLD):
+    lines, regressions = [], 0
+    for name in sorted(set(base["results"]) | set(new["results"])):
+        if name not in base["results"] or name not in new["results"]:
+            lines.append(f"{name:<42} {'нет в базовых' if name not in base['results'] else 'нет в новых':>30}")
+            continue
+        old, current = base["results"][name]["us_median"], new["results"][name]["us_median"]
+        change = current / old - 1 if old else 0.0
+        status = ""
+        if change > threshold:
+            status = "РЕГРЕССИЯ"
+            regressions += 1
+        elif change < -threshold:
+            status = "ускорение"
+        lines.append(f"{name:<42} {old:>11.2f} {current:>11.2f} {change:>+8.1%}  {status}")
+    return lines, regressions
+
+
+def report(data):
+    for name, result in data["results"].items():
+        print(f"{name:<42} {result['us_median']:>11.2f} мкс (мин. {result['us_min']:.2f}, вызовов {result['calls']})")
+
+
+# Примеры:
+#   python -m games.bench results.json              - все наборы, результаты в JSON
+#   python -m games.bench runner tetris             - только выбранные игры
+#   python -m games.bench compare base.json new.json 0.1 - сравнение, код возврата 1 при регрессиях
+def cli():
+    args = sys.argv[1:]
+    if args[:1] == ["compare"]:
+        with open(args[1]) as file:
+            base = json.load(file)
+        with open(args[2]) as file:
+            new = json.load(file)
+        threshold = float(args[3]) if len(args) > 3 else THRESHOLD
+        lines, regressions = compare(base, new, threshold)
+        print(f"{'замер':<42} {'было, мкс':>11} {'стало, мкс':>11} {'изм.':>8}")
+        print("\n".join(lines))
+        print(f"регрессий (порог {threshold:.0%}): {regressions}")
+        sys.exit(1 if regressions else 0)
+    output = next((arg for arg in args if arg.endswith(".json")), None)
+    data = run([arg for arg in args if not arg.endswith(".json")])
+    report(data)
+    if output is not None:
+        with open(output, "w") as file:
+            json.dump(data, file, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,163 @@
+import pygame
+import sys
+import time
+
+from games import assets
+
+try:
+    import numpy as np  # Нужен только для нагрузочного режима
+except ImportError:
+    np = None
+
+ASSETS = ["img/picPython_1.png", "img/picPython_2.png"]
+window_size = (800, 600)
+
+
+# Создание окна; изображения тем временем загружаются в фоновом потоке
+def open_window():
+    assets.preload(ASSETS)
+    pygame.init()
+    screen = pygame.display.set_mode(window_size)
+    pygame.display.set_caption("Тестовый проект")
+    return screen
+
+
+# Широкая фаза "сортировка и отсечение" (sweep and prune): объекты сортируются по левому
+# краю, для каждого берутся следующие за ним объекты, левый край которых левее его правого
+# края, затем отбрасываются пары, не пересекающиеся по вертикали. Возвращает индексы пар
+def sweep_and_prune(x, y, width, height):
+    count = len(x)
+    order = np.argsort(x, kind="stable")
+    left = x[order]
+    end = np.searchsorted(left, left + width[order])  # Первый объект правее правого края
+    counts = np.maximum(end - np.arange(count) - 1, 0)
+    first = np.repeat(np.arange(count), counts)
+    second = first + 1 + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    a, b = order[first], order[second]
+    keep = (y[b] < y[a] + height[a]) & (y[a] < y[b] + height[b])
+    return a[keep], b[keep]
+
+
+# Узкая фаза: пары-кандидаты подтверждаются попиксельно по маскам изображений
+def confirm_pairs(a, b, x, y, kinds, masks):
+    x, y, kinds = x.tolist(), y.tolist(), kinds.tolist()
+    return [(i, j) for i, j in zip(a.tolist(), b.tolist())
+            if masks[kinds[i]].overlap(masks[kinds[j]], (x[j] - x[i], y[j] - y[i]))]
+
+
+# Нагрузочный режим: count копий изображений движутся по экрану, столкновения ищутся
+# широкой фазой sweep_and_prune и подтверждаются по маскам. Раз в секунду выводится
+# количество пар и время фаз; frames - ограничение числа кадров (для запуска без окна)
+def stress(count, frames=None, seed=0):
+    if np is None:
+        sys.exit("Для нагрузочного режима нужен numpy: pip install numpy")
+    screen = open_window()
+    rng = np.random.default_rng(seed)
+    images = [assets.load(name) for name in ASSETS]
+    masks = [assets.mask(name) for name in ASSETS]  # Маски строятся один раз для каждого изображения
+    kinds = rng.integers(0, len(images), count)
+    width = np.array([image.get_width() for image in images])[kinds]
+    height = np.array([image.get_height() for image in images])[kinds]
+    x = rng.integers(0, window_size[0] - width)
+    y = rng.integers(0, window_size[1] - height)
+    dx = rng.choice([-3, -2, -1, 1, 2, 3], count)
+    dy = rng.choice([-3, -2, -1, 1, 2, 3], count)
+    totals = {"frames": 0, "candidates": 0, "pairs": 0, "broad_ms": 0.0, "narrow_ms": 0.0, "frame_ms": 0.0}
+    report = time.perf_counter()
+    while frames is None or totals["frames"] < frames:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                frames = totals["frames"]
+        start = time.perf_counter()
+        # Движение с отражением от краев окна
+        x += dx
+        y += dy
+        dx[(x < 0) | (x > window_size[0] - width)] *= -1
+        dy[(y < 0) | (y > window_size[1] - height)] *= -1
+        np.clip(x, 0, window_size[0] - width, out=x)
+        np.clip(y, 0, window_size[1] - height, out=y)
+        broad = time.perf_counter()
+        a, b = sweep_and_prune(x, y, width, height)
+        narrow = time.perf_counter()
+        pairs = confirm_pairs(a, b, x, y, kinds, masks)
+        done = time.perf_counter()
+        screen.fill((0, 0, 0))
+        screen.blits([(images[kind], position) for kind, position in zip(kinds.tolist(), zip(x.tolist(), y.tolist()))],
+                     False)
+        pygame.display.update()
+        end = time.perf_counter()
+        totals["frames"] += 1
+        totals["candidates"] += len(a)
+        totals["pairs"] += len(pairs)
+        totals["broad_ms"] += (narrow - broad) * 1000
+        totals["narrow_ms"] += (done - narrow) * 1000
+        totals["frame_ms"] += (end - start) * 1000
+        if end - report >= 1:
+            report = end
+            print(f"объектов: {count}, кандидатов: {len(a)}, столкновений: {len(pairs)}, "
+                  f"широкая фаза: {(narrow - broad) * 1000:.2f} мс, узкая фаза: {(done - narrow) * 1000:.2f} мс, "
+                  f"кадр: {(end - start) * 1000:.2f} мс")
+    frames = max(totals["frames"], 1)
+    summary = {"objects": count, "frames": totals["frames"]}
+    summary.update({key: totals[key] / frames for key in ("candidates", "pairs", "broad_ms", "narrow_ms", "frame_ms")})
+    print(summary)
+    return summary
+
+
+# Изображение, перемещаемое мышью, и проверка столкновения с неподвижным изображением;
+# завершается при закрытии окна
+def main():
+    screen = open_window()
+    image_1 = assets.load("img/picPython_1.png")  # Из кэша, в формате экрана
+    image_rect_1 = image_1.get_rect()
+
+    image_2 = assets.load("img/picPython_2.png")
+    image_rect_2 = image_2.get_rect()
+
+    # speed = 0.5
+
+    run = True
+
+    while run:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                run = False
+            if event.type == pygame.MOUSEMOTION:
+                mouseX, mouseY = pygame.mouse.get_pos()
+                image_rect_1.x = mouseX - 25
+                image_rect_1.y = mouseY - 25
+
+        if image_rect_1.colliderect(image_rect_2):
+            print("Произошло столкновение")
+            time.sleep(1)
+
+        # keys = pygame.key.get_pressed()
+        # if keys[pygame.K_LEFT]:
+        #     image_rect.x -= speed
+        # if keys[pygame.K_RIGHT]:
+        #     image_rect.x += speed
+        # if keys[pygame.K_UP]:
+        #     image_rect.y -= speed
+        # if keys[pygame.K_DOWN]:
+        #     image_rect.y += speed
+
+        screen.fill((0, 0, 0))
+        screen.blit(image_1, image_rect_1)
+        screen.blit(image_2, image_rect_2)
+        pygame.display.update()
+
+    print(assets.stats())
+
+
+# Запуск из командной строки: демонстрация или нагрузочный режим
+def cli():
+    if sys.argv[1:2] == ["stress"]:
+        # Пример: python lw_OB05.py stress 2000 (третий аргумент - ограничение числа кадров)
+        stress(int(sys.argv[2]) if len(sys.argv) > 2 else 1000, int(sys.argv[3]) if len(sys.argv) > 3 else None)
+        print(assets.stats())
+    else:
+        main()
+
+
+if __name__ == "__main__":
+    cli()
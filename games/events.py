@@ -0,0 +1,7 @@
+import pygame
+
+
+# Ожидание событий без загрузки процессора: блокируется до первого события,
+# затем забирает все накопившиеся. Используется в меню и экранах ожидания игр
+def wait():
+    return [pygame.event.wait()] + pygame.event.get()
@@ -0,0 +1,155 @@
+import atexit
+import csv
+import json
+import os
+import time
+import pygame
+
+from games import text_cache
+
+PHASES = ("events", "update", "draw", "flip", "wait")  # Фазы кадра; wait - ожидание clock.tick и прочее
+PHASE_INDEX = {name: index for index, name in enumerate(PHASES)}
+WAIT = PHASE_INDEX["wait"]
+HOTKEY = pygame.K_F3  # Клавиша показа оверлея
+OVERLAY_REFRESH = 0.5  # Период обновления текста оверлея, с
+OVERLAY_COLOR = (255, 255, 0)
+
+
+def _noop(*args):
+    pass
+
+
+# Замер времени кадров игрового цикла по фазам. Длительности хранятся в кольцевом
+# буфере последних size кадров; по ним оверлей показывает FPS, медиану и 99-й
+# процентиль времени кадра и среднее время каждой фазы. Выключенный профилировщик
+# заменяет frame/mark/skip пустой функцией, поэтому в цикле не выполняется никакой работы.
+# Цикл вызывает frame() в начале кадра и mark(фаза) после каждой фазы; время от последней
+# отметки до следующего кадра относится к фазе wait
+class FrameProfiler:
+    def __init__(self, size=600):
+        self.size = size
+        self.samples = [None] * size  # Кольцевой буфер: (время кадра, время фаз) в секундах
+        self.count = 0  # Количество записанных кадров
+        self.collect = False  # Сбор включен постоянно (переменная окружения FRAME_STATS)
+        self.overlay = False  # Оверлей показан
+        self.start = None  # Начало текущего кадра
+        self.last = 0.0  # Время последней отметки
+        self.current = [0.0] * len(PHASES)  # Время фаз текущего кадра
+        self.file = None  # Файл для записи кадров (CSV или JSON Lines)
+        self.writer = None  # csv.writer для CSV; для JSON Lines строки пишутся в файл напрямую
+        self.lines = []  # Строки оверлея, отрисованные при последнем обновлении
+        self.refreshed = 0.0  # Время последнего обновления оверлея
+        self.set_enabled(False)
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self.start = None
+        for name in ("frame", "mark", "skip"):
+            if enabled:
+                self.__dict__.pop(name, None)  # Снова используются методы класса
+            else:
+                setattr(self, name, _noop)
+
+    def frame(self):
+        # Начало нового кадра; предыдущий кадр записывается в буфер
+        now = time.perf_counter()
+        if self.start is not None:
+            self.current[WAIT] += now - self.last
+            self.record(now - self.start, self.current)
+        self.start = self.last = now
+        self.current = [0.0] * len(PHASES)
+
+    def mark(self, phase):
+        # Конец фазы phase текущего кадра
+        now = time.perf_counter()
+        self.current[PHASE_INDEX[phase]] += now - self.last
+        self.last = now
+
+    def skip(self):
+        # Текущий кадр не записывается (например, игра ушла в меню)
+        self.start = None
+
+    def record(self, total, phases):
+        self.samples[self.count % self.size] = (total, tuple(phases))
+        self.count += 1
+        if self.file is not None:
+            row = [self.count, round(total * 1000, 4)] + [round(value * 1000, 4) for value in phases]
+            if self.writer is not None:
+                self.writer.writerow(row)
+            else:
+                self.file.write(json.dumps(dict(zip(["frame", "total_ms"] + [f"{name}_ms" for name in PHASES], row)))
+                                + "\n")
+
+    def stream(self, path):
+        # Запись каждого кадра в файл: CSV (по расширению .csv) или JSON Lines
+        self.file = open(path, "w", newline="")
+        if path.endswith(".csv"):
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(["frame", "total_ms"] + [f"{name}_ms" for name in PHASES])
+        atexit.register(self.close)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = self.writer = None
+
+    def stats(self):
+        # Статистика по кадрам в буфере: FPS, p50 и p99 времени кадра и среднее время фаз, мс
+        samples = self.samples[:min(self.count, self.size)]
+        if not samples:
+            return None
+        totals = sorted(total for total, _ in samples)
+        result = {
+            "frames": len(samples),
+            "fps": len(samples) / sum(totals) if sum(totals) else 0.0,
+            "p50_ms": totals[len(totals) // 2] * 1000,
+            "p99_ms": totals[min(len(totals) - 1, int(len(totals) * 0.99))] * 1000,
+        }
+        for index, name in enumerate(PHASES):
+            result[f"{name}_ms"] = sum(phases[index] for _, phases in samples) / len(samples) * 1000
+        return result
+
+    def handle_event(self, event):
+        # Показ и скрытие оверлея по клавише HOTKEY; возвращает True, если событие обработано
+        # (игра должна перерисовать экран целиком, чтобы убрать или показать оверлей)
+        if event.type != pygame.KEYDOWN or event.key != HOTKEY:
+            return False
+        self.overlay = not self.overlay
+        if self.overlay != self.enabled and not (self.collect or self.file is not None):
+            self.set_enabled(self.overlay)
+        self.refreshed = 0.0
+        return True
+
+    def draw_overlay(self, screen):
+        # Отрисовка оверлея в левом верхнем углу; возвращает его область или None
+        if not self.overlay:
+            return None
+        now = time.perf_counter()
+        if now - self.refreshed >= OVERLAY_REFRESH:
+            # Текст меняется только при обновлении, между обновлениями строки берутся готовыми
+            self.refreshed = now
+            stats = self.stats()
+            if stats is None:
+                texts = ["FPS -"]
+            else:
+                texts = [f"FPS {stats['fps']:.1f}",
+                         f"p50 {stats['p50_ms']:.1f} мс, p99 {stats['p99_ms']:.1f} мс"]
+                texts += [f"{name} {stats[f'{name}_ms']:.2f} мс" for name in PHASES]
+            font = text_cache.font(None, 20)
+            self.lines = [text_cache.render(font, text, OVERLAY_COLOR) for text in texts]
+        area = pygame.Rect(0, 0, 210, 4 + 16 * (len(PHASES) + 2))
+        screen.fill((0, 0, 0), area)
+        for index, line in enumerate(self.lines):
+            screen.blit(line, (4, 2 + index * 16))
+        return area
+
+
+# Общий экземпляр, который используют все игры. Переменная окружения FRAME_STATS
+# включает сбор с запуска: FRAME_STATS=1 - только сбор, FRAME_STATS=frames.csv
+# (или frames.jsonl) - сбор и запись каждого кадра в файл
+profiler = FrameProfiler()
+if os.environ.get("FRAME_STATS"):
+    profiler.collect = True
+    profiler.set_enabled(True)
+    if os.environ["FRAME_STATS"] != "1":
+        profiler.stream(os.environ["FRAME_STATS"])
@@ -0,0 +1,95 @@
+import importlib
+import time
+import pygame
+
+from games import events, frame_stats, text_cache
+
+# Игры лаунчера: название в меню и модуль с функцией main()
+GAMES = [
+    ("Пинг-понг", "games.pingpong"),
+    ("Змейка", "games.snake"),
+    ("Тетрис", "games.tetris"),
+    ("Раннер", "games.runner"),
+    ("Столкновения изображений", "games.collisions"),
+]
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
+WHITE = (255, 255, 255)
+GRAY = (128, 128, 128)
+BLACK = (0, 0, 0)
+
+
+# Единый лаунчер: Pygame и окно создаются один раз на весь процесс, модуль игры
+# импортируется только при первом выборе, а после выхода из игры управление
+# возвращается в меню без перезапуска интерпретатора
+class Launcher:
+    def __init__(self):
+        pygame.init()
+        self.font = text_cache.font(None, 48, sysfont=True)
+        self.selected = 0  # Выбранный пункт меню
+        self.load_times = {}  # Модуль -> время первого импорта, мс
+        self.open()
+
+    def open(self):
+        # Окно лаунчера; при возврате из игры используется то же окно с прежним размером
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Игры")
+        pygame.key.set_repeat()  # Игра могла включить повтор клавиш
+        pygame.event.clear()  # События, оставшиеся после выхода из игры
+        top = (SCREEN_HEIGHT - len(GAMES) * 80) // 2
+        self.rects = []  # Области пунктов меню
+        for index, (title, _) in enumerate(GAMES):
+            width, height = self.font.size(title)
+            self.rects.append(pygame.Rect((SCREEN_WIDTH - width) // 2, top + index * 80, width, height))
+
+    def item_at(self, position):
+        # Пункт меню под указателем мыши или None
+        for index, rect in enumerate(self.rects):
+            if rect.collidepoint(position):
+                return index
+        return None
+
+    def load(self, name):
+        # Модуль игры импортируется при первом выборе; повторный выбор берет его из sys.modules
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        self.load_times.setdefault(name, (time.perf_counter() - start) * 1000)
+        return module
+
+    def launch(self, index):
+        self.load(GAMES[index][1]).main()
+        frame_stats.profiler.skip()  # Время в лаунчере не относится к кадрам следующей игры
+        self.open()
+
+    def draw(self):
+        self.screen.fill(BLACK)
+        for index, ((title, _), rect) in enumerate(zip(GAMES, self.rects)):
+            color = WHITE if index == self.selected else GRAY
+            self.screen.blit(text_cache.render(self.font, title, color), rect)
+        pygame.display.flip()
+
+    def run(self):
+        while True:
+            self.draw()
+            for event in events.wait():
+                if event.type == pygame.QUIT:
+                    return
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return
+                    elif event.key == pygame.K_UP:
+                        self.selected = (self.selected - 1) % len(GAMES)
+                    elif event.key == pygame.K_DOWN:
+                        self.selected = (self.selected + 1) % len(GAMES)
+                    elif event.key == pygame.K_RETURN:
+                        self.launch(self.selected)
+                        break  # Оставшиеся события относятся ко времени до запуска игры
+                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.item_at(event.pos) is not None:
+                    self.selected = self.item_at(event.pos)
+                    self.launch(self.selected)
+                    break
+
+
+def main():
+    Launcher().run()
+    pygame.quit()
@@ -0,0 +1,552 @@
+import pygame
+import asyncio
+import os
+import random
+import struct
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from games import frame_stats, sprite_atlas
+
+# Константы для размеров экрана, скоростей мяча и ракеток, и цветов
+SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600  # Размеры экрана
+BALL_SPEED = 5  # Скорость мяча
+PADDLE_SPEED = 10  # Скорость ракеток
+WHITE = (255, 255, 255)  # Белый цвет в RGB
+BLACK = (0, 0, 0)  # Черный цвет в RGB
+POINTS_TO_WIN = 5  # Количество очков для победы в матче без окна
+AIM_ERROR = 90  # Максимальная ошибка прицеливания ИИ в пикселях (больше половины ракетки - возможен промах)
+NET_PORT = 50007  # Порт UDP для сетевой игры
+NET_FPS = 60  # Частота кадров сетевой игры (и отправки пакетов)
+
+# Пакеты сетевой игры: ввод клиента (тип, номер ввода, время отправки, направление)
+# и состояние хоста (тип, кадр, последний примененный ввод, эхо времени отправки ввода,
+# положение и скорость мяча, положения ракеток по вертикали, очки).
+# Сетевая игра идет без ограничения очков, поэтому очки передаются по модулю 65536
+INPUT, STATE = 1, 2
+INPUT_PACKET = struct.Struct("!BIdb")
+STATE_PACKET = struct.Struct("!BIIdhhffhhHH")
+SCORE_MASK = 0xFFFF
+
+
+# Класс Paddle для управления ракетками
+class Paddle:
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)  # Создание прямоугольника для ракетки
+        self.speed = PADDLE_SPEED  # Установка скорости ракетки
+        self.aim = 0  # Смещение точки прицеливания (используется управляющей функцией ИИ)
+
+    # Метод для перемещения ракетки вверх
+    def move_up(self):
+        if self.rect.top > 0:  # Проверка, чтобы ракетка не вышла за верхнюю границу экрана
+            self.rect.y -= self.speed  # Перемещение ракетки вверх
+
+    # Метод для перемещения ракетки вниз
+    def move_down(self):
+        if self.rect.bottom < SCREEN_HEIGHT:  # Проверка, чтобы ракетка не вышла за нижнюю границу экрана
+            self.rect.y += self.speed  # Перемещение ракетки вниз
+
+    # Метод для перемещения ракетки по команде управляющей функции: -1 - вверх, 1 - вниз, 0 - на месте
+    def move(self, direction):
+        if direction < 0:
+            self.move_up()
+        elif direction > 0:
+            self.move_down()
+
+    # Метод для отрисовки ракетки на экране
+    def draw(self, screen):
+        pygame.draw.rect(screen, WHITE, self.rect)  # Отрисовка ракетки в виде белого прямоугольника
+
+
+# Класс Ball для управления мячом
+class Ball:
+    MAX_BOUNCES = 4  # Максимальное количество отскоков за один шаг физики
+
+    def __init__(self, x, y, radius):
+        self.rect = pygame.Rect(x, y, radius*2, radius*2)  # Создание прямоугольника для мяча
+        self.x, self.y = float(x), float(y)  # Точное положение мяча (прямоугольник хранит целые координаты)
+        self.dx = BALL_SPEED  # Скорость мяча по горизонтали
+        self.dy = BALL_SPEED  # Скорость мяча по вертикали
+        # Мяч отрисовывается один раз в атлас спрайтов и затем только копируется на экран
+        self.atlas = sprite_atlas.SpriteAtlas()
+        self.atlas.add("ball", self.rect.size, lambda surface, rect: pygame.draw.ellipse(surface, WHITE, rect))
+
+    # Метод для перемещения мяча с непрерывной проверкой столкновений: за шаг dt (в кадрах
+    # по 1/60 секунды) находится время первого касания стены или ракетки, мяч перемещается
+    # точно до него, отражается и продолжает движение оставшееся время. Поэтому мяч не
+    # проходит сквозь ракетку при любой скорости и не отражается повторно, пока касается ее
+    def move(self, paddles=(), dt=1.0):
+        remaining = dt
+        for _ in range(self.MAX_BOUNCES):
+            impact = self.first_impact(paddles, remaining)
+            if impact is None:
+                break
+            time, axis = impact
+            self.x += self.dx * time
+            self.y += self.dy * time
+            remaining -= time
+            if axis == "x":
+                self.dx = -self.dx  # Изменение направления движения по горизонтали
+            else:
+                self.dy = -self.dy  # Изменение направления движения по вертикали
+        self.x += self.dx * remaining
+        self.y += self.dy * remaining
+        self.rect.x, self.rect.y = round(self.x), round(self.y)
+
+    # Метод для поиска ближайшего столкновения за время limit: (время, ось отражения) или None
+    def first_impact(self, paddles, limit):
+        impact = None
+        # Верхняя и нижняя границы экрана
+        if self.dy < 0:
+            impact = (-self.y / self.dy, "y")
+        elif self.dy > 0:
+            impact = ((SCREEN_HEIGHT - self.rect.height - self.y) / self.dy, "y")
+        if impact is not None and not 0 <= impact[0] <= limit:
+            impact = None
+        for paddle in paddles:
+            hit = self.time_of_impact(paddle.rect, limit)
+            if hit is not None and (impact is None or hit[0] < impact[0]):
+                impact = hit
+        return impact
+
+    # Метод для поиска времени касания ракетки (swept AABB): прямоугольник ракетки
+    # расширяется на размер мяча, и движение мяча проверяется как луч из его угла.
+    # Если мяч уже пересекается с ракеткой или удаляется от нее, столкновения нет
+    def time_of_impact(self, rect, limit):
+        entry, exit_ = [], []
+        for position, speed, low, high in ((self.x, self.dx, rect.left - self.rect.width, rect.right),
+                                           (self.y, self.dy, rect.top - self.rect.height, rect.bottom)):
+            if speed == 0:
+                if not low < position < high:
+                    return None
+                entry.append(float("-inf"))
+                exit_.append(float("inf"))
+            elif speed > 0:
+                entry.append((low - position) / speed)
+                exit_.append((high - position) / speed)
+            else:
+                entry.append((high - position) / speed)
+                exit_.append((low - position) / speed)
+        time = max(entry)
+        if time < 0 or time > limit or time >= min(exit_):
+            return None
+        return time, "x" if entry[0] >= entry[1] else "y"
+
+    # Метод для отрисовки мяча на экране
+    def draw(self, screen):
+        self.atlas.blit(screen, "ball", self.rect.topleft)  # Отрисовка мяча в виде белого эллипса
+
+    # Метод для сброса позиции мяча к центру экрана
+    def reset(self, x, y):
+        self.rect.x = x  # Установка новой позиции по горизонтали
+        self.rect.y = y  # Установка новой позиции по вертикали
+        self.x, self.y = float(x), float(y)
+        self.dx = BALL_SPEED  # Сброс скорости мяча по горизонтали
+        self.dy = BALL_SPEED  # Сброс скорости мяча по вертикали
+
+
+# Класс Game для управления всей игрой
+# Управляющая функция получает игру и ракетку и возвращает направление движения:
+# -1 - вверх, 1 - вниз, 0 - на месте. Этим игра отделена от клавиатуры и окна
+class Game:
+    def __init__(self, left_controller=None, right_controller=None, rng=None):
+        self.rng = rng or random  # Генератор случайных чисел (для воспроизводимых матчей)
+        self.controllers = (left_controller, right_controller)  # Управляющие функции ракеток
+        self.score = [0, 0]  # Очки левого и правого игрока
+        self.ball = Ball(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, 15)  # Создание мяча в центре экрана
+        self.left_paddle = Paddle(30, SCREEN_HEIGHT // 2 - 60, 20, 120)  # Создание левой ракетки
+        self.right_paddle = Paddle(SCREEN_WIDTH - 50, SCREEN_HEIGHT // 2 - 60, 20, 120)  # Создание правой ракетки
+
+    # Метод для обработки столкновений мяча с ракетками: перемещение мяча с непрерывной
+    # проверкой столкновений со стенами и обеими ракетками
+    def handle_collision(self):
+        self.ball.move((self.left_paddle, self.right_paddle))
+
+    # Метод для проверки, забит ли гол (мяч вышел за границу экрана)
+    def check_score(self):
+        if self.ball.rect.left <= 0 or self.ball.rect.right >= SCREEN_WIDTH:  # Мяч вышел за левую или правую границу
+            self.score[self.ball.rect.left <= 0] += 1  # Очко получает игрок с противоположной стороны
+            self.ball.reset(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)  # Сброс мяча в центр экрана
+
+    # Метод для отрисовки всех элементов игры
+    def draw(self, screen):
+        screen.fill(BLACK)  # Заполнение экрана черным цветом
+        self.ball.draw(screen)  # Отрисовка мяча
+        self.left_paddle.draw(screen)  # Отрисовка левой ракетки
+        self.right_paddle.draw(screen)  # Отрисовка правой ракетки
+
+    # Метод для обновления состояния игры
+    def update(self):
+        # Перемещение ракеток по командам управляющих функций
+        for paddle, controller in zip((self.left_paddle, self.right_paddle), self.controllers):
+            if controller is not None:
+                paddle.move(controller(self, paddle))
+        self.handle_collision()  # Перемещение мяча с обработкой столкновений
+        self.check_score()  # Проверка, забит ли гол
+
+
+# Управляющая функция для игрока: ракетка движется клавишами up и down
+def keyboard_controller(up, down):
+    def control(game, paddle):
+        keys = pygame.key.get_pressed()
+        return keys[down] - keys[up]
+    return control
+
+
+# Управляющая функция ИИ: пока мяч летит к ракетке, она движется к мячу со случайной
+# ошибкой прицеливания (выбирается заново на каждый удар), иначе возвращается в центр
+def tracking_controller(game, paddle):
+    ball = game.ball
+    approaching = (ball.dx < 0) == (paddle is game.left_paddle)
+    if approaching:
+        target = ball.rect.centery + paddle.aim
+    else:
+        paddle.aim = game.rng.uniform(-AIM_ERROR, AIM_ERROR)
+        target = SCREEN_HEIGHT // 2
+    if abs(target - paddle.rect.centery) < paddle.speed:
+        return 0
+    return 1 if target > paddle.rect.centery else -1
+
+
+def simulate_match(seed, left=tracking_controller, right=tracking_controller, points=POINTS_TO_WIN,
+                   max_frames=1_000_000):
+    # Один матч без окна и без ограничения частоты кадров: до points очков или max_frames кадров
+    game = Game(left, right, random.Random(seed))
+    frames = 0
+    while max(game.score) < points and frames < max_frames:
+        game.update()
+        frames += 1
+    winner = None
+    if game.score[0] != game.score[1]:
+        winner = "left" if game.score[0] > game.score[1] else "right"
+    return {"seed": seed, "left": game.score[0], "right": game.score[1], "winner": winner, "frames": frames}
+
+
+def run_matches(matches, left=tracking_controller, right=tracking_controller, seed=0, workers=None,
+                points=POINTS_TO_WIN, max_frames=1_000_000):
+    # Запуск matches матчей на всех ядрах процессора и сбор общей статистики
+    run_one = partial(simulate_match, left=left, right=right, points=points, max_frames=max_frames)
+    seeds = range(seed, seed + matches)
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run_one, seeds, chunksize=max(1, matches // (workers * 4))))
+    elapsed = time.perf_counter() - start
+    frames = sum(result["frames"] for result in results)
+    return {
+        "matches": matches,
+        "workers": workers,
+        "left_wins": sum(result["winner"] == "left" for result in results),
+        "right_wins": sum(result["winner"] == "right" for result in results),
+        "draws": sum(result["winner"] is None for result in results),
+        "frames": frames,
+        "mean_frames": frames / matches,
+        "max_frames": max(result["frames"] for result in results),
+        "elapsed": elapsed,
+        "matches_per_sec": matches / elapsed,
+        "frames_per_sec": frames / elapsed,
+    }
+
+
+# Статистика сетевого соединения: пакеты, потери, время приема-передачи и пакеты в секунду
+class NetStats:
+    def __init__(self):
+        self.sent = 0  # Отправлено пакетов
+        self.received = 0  # Получено пакетов
+        self.lost = 0  # Пропущено пакетов (по номерам кадров и вводов)
+        self.rtt = None  # Сглаженное время приема-передачи, с
+        self.pps_in = self.pps_out = 0.0  # Пакетов в секунду за последнюю секунду
+        self.window = (time.perf_counter(), 0, 0)  # Начало окна подсчета и счетчики на его начало
+
+    def add_rtt(self, sample):
+        self.rtt = sample if self.rtt is None else self.rtt * 0.9 + sample * 0.1
+
+    def tick(self):
+        # Пересчет пакетов в секунду раз в секунду; возвращает True, если значения обновились
+        start, sent, received = self.window
+        now = time.perf_counter()
+        if now - start < 1:
+            return False
+        self.pps_out = (self.sent - sent) / (now - start)
+        self.pps_in = (self.received - received) / (now - start)
+        self.window = (now, self.sent, self.received)
+        return True
+
+    def as_dict(self):
+        return {"sent": self.sent, "received": self.received, "lost": self.lost,
+                "rtt_ms": self.rtt * 1000 if self.rtt is not None else None,
+                "pps_in": self.pps_in, "pps_out": self.pps_out}
+
+
+# Прослойка для проверки сетевой игры на локальной машине: задержка с разбросом и потеря пакетов
+class LossyTransport:
+    def __init__(self, transport, latency=0.0, jitter=0.0, loss=0.0, seed=None):
+        self.transport = transport
+        self.latency = latency  # Задержка доставки, с
+        self.jitter = jitter  # Максимальная случайная добавка к задержке, с (пакеты могут прийти не по порядку)
+        self.loss = loss  # Доля потерянных пакетов
+        self.rng = random.Random(seed)
+
+    def sendto(self, data, addr=None):
+        if self.rng.random() < self.loss:
+            return
+        delay = self.latency + self.rng.uniform(0, self.jitter)
+        asyncio.get_running_loop().call_later(delay, self._deliver, data, addr)
+
+    def _deliver(self, data, addr):
+        if not self.transport.is_closing():
+            self.transport.sendto(data, addr)
+
+    def close(self):
+        self.transport.close()
+
+
+# Общая часть хоста и клиента: протокол asyncio поверх UDP
+class NetPeer(asyncio.DatagramProtocol):
+    def __init__(self, shim=None):
+        self.shim = shim  # Параметры LossyTransport для проверки на локальной машине
+        self.transport = None
+        self.stats = NetStats()
+
+    def connection_made(self, transport):
+        self.transport = LossyTransport(transport, **self.shim) if self.shim else transport
+
+    def send(self, data, addr=None):
+        self.transport.sendto(data, addr)
+        self.stats.sent += 1
+
+    def datagram_received(self, data, addr):
+        # Пакеты неизвестного типа или размера отбрасываются
+        if data[:1] == bytes([INPUT]) and len(data) == INPUT_PACKET.size:
+            self.stats.received += 1
+            self.on_input(INPUT_PACKET.unpack(data), addr)
+        elif data[:1] == bytes([STATE]) and len(data) == STATE_PACKET.size:
+            self.stats.received += 1
+            self.on_state(STATE_PACKET.unpack(data))
+
+    def on_input(self, packet, addr):
+        pass
+
+    def on_state(self, packet):
+        pass
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+
+
+# Хост: ведет авторитетное состояние игры, управляет левой ракеткой, правая ракетка
+# движется по последнему вводу клиента. Состояние отправляется клиенту на каждом кадре,
+# поэтому потерянный пакет заменяется следующим
+class NetHost(NetPeer):
+    def __init__(self, local_controller, shim=None, rng=None):
+        super().__init__(shim)
+        self.game = Game(local_controller, self.remote_controller, rng)
+        self.client = None  # Адрес клиента (первый приславший ввод)
+        self.input_seq = 0  # Номер последнего примененного ввода клиента
+        self.input_time = 0.0  # Время отправки этого ввода по часам клиента (для RTT)
+        self.input_received = 0.0  # Время получения этого ввода по часам хоста
+        self.direction = 0  # Направление движения правой ракетки по вводу клиента
+        self.frame = 0
+
+    def remote_controller(self, game, paddle):
+        return self.direction
+
+    def on_input(self, packet, addr):
+        _, seq, sent, direction = packet
+        if self.client is None:
+            self.client = addr
+        if addr != self.client or seq <= self.input_seq:
+            return  # Чужой, повторный или устаревший пакет
+        self.stats.lost += seq - self.input_seq - 1
+        self.input_seq, self.input_time, self.direction = seq, sent, direction
+        self.input_received = time.perf_counter()
+
+    def step(self):
+        self.game.update()
+        self.frame += 1
+        if self.client is not None:
+            ball = self.game.ball
+            # Эхо времени ввода сдвигается на время его ожидания на хосте, чтобы RTT учитывал только сеть
+            echo = self.input_time + (time.perf_counter() - self.input_received) if self.input_seq else 0.0
+            self.send(STATE_PACKET.pack(STATE, self.frame, self.input_seq, echo, ball.rect.x, ball.rect.y,
+                                        ball.dx, ball.dy, self.game.left_paddle.rect.y, self.game.right_paddle.rect.y,
+                                        *(points & SCORE_MASK for points in self.game.score)), self.client)
+        self.stats.tick()
+
+
+# Клиент: управляет правой ракеткой с предсказанием - ввод применяется сразу и
+# отправляется хосту, а при получении состояния ракетка ставится в положение хоста
+# и повторяются еще не подтвержденные хостом вводы. Мяч между пакетами движется
+# по той же физике и выравнивается по каждому полученному состоянию
+class NetClient(NetPeer):
+    def __init__(self, local_controller, shim=None):
+        super().__init__(shim)
+        self.game = Game()
+        self.local_controller = local_controller
+        self.seq = 0  # Номер последнего отправленного ввода
+        self.pending = deque()  # Вводы, еще не подтвержденные хостом: (номер, направление)
+        self.frame = 0  # Кадр хоста последнего примененного состояния
+
+    def step(self):
+        game = self.game
+        direction = self.local_controller(game, game.right_paddle)
+        self.seq += 1
+        self.pending.append((self.seq, direction))
+        game.right_paddle.move(direction)
+        self.send(INPUT_PACKET.pack(INPUT, self.seq, time.perf_counter(), direction))
+        game.handle_collision()
+        self.stats.tick()
+
+    def on_state(self, packet):
+        _, frame, ack, sent, x, y, dx, dy, left_y, right_y, left_score, right_score = packet
+        if frame <= self.frame:
+            return  # Устаревший пакет, пришедший не по порядку
+        if self.frame:
+            self.stats.lost += frame - self.frame - 1
+        self.frame = frame
+        if sent:
+            self.stats.add_rtt(time.perf_counter() - sent)
+        game = self.game
+        ball = game.ball
+        ball.x, ball.y, ball.dx, ball.dy = float(x), float(y), dx, dy
+        ball.rect.topleft = (x, y)
+        game.left_paddle.rect.y = left_y
+        game.score = [left_score, right_score]
+        # Сверка предсказания: положение хоста плюс неподтвержденные вводы
+        while self.pending and self.pending[0][0] <= ack:
+            self.pending.popleft()
+        game.right_paddle.rect.y = right_y
+        for _, direction in self.pending:
+            game.right_paddle.move(direction)
+
+
+# Цикл сетевой игры: кадры с частотой NET_FPS без блокировки цикла событий asyncio.
+# Без окна (screen=None) выполняется frames кадров
+async def run_net_game(peer, screen=None, frames=None):
+    loop = asyncio.get_running_loop()
+    next_frame = loop.time()
+    frame = 0
+    while frames is None or frame < frames:
+        if screen is not None:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+        peer.step()
+        frame += 1
+        if screen is not None:
+            peer.game.draw(screen)
+            pygame.display.flip()
+            if peer.stats.pps_out and frame % NET_FPS == 0:
+                rtt = f"{peer.stats.rtt * 1000:.0f} мс" if peer.stats.rtt is not None else "-"
+                pygame.display.set_caption(f"Пинг-Понг: RTT {rtt}, пакетов/с {peer.stats.pps_in:.0f}/{peer.stats.pps_out:.0f}")
+        next_frame += 1 / NET_FPS
+        await asyncio.sleep(max(0.0, next_frame - loop.time()))
+
+
+# Сетевая игра с окном: хост (левая ракетка, W/S) или клиент (правая ракетка, стрелки)
+async def play_net(host=None, port=NET_PORT):
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Пинг-Понг")
+    loop = asyncio.get_running_loop()
+    if host is None:
+        _, peer = await loop.create_datagram_endpoint(
+            lambda: NetHost(keyboard_controller(pygame.K_w, pygame.K_s)), local_addr=("0.0.0.0", port))
+    else:
+        _, peer = await loop.create_datagram_endpoint(
+            lambda: NetClient(keyboard_controller(pygame.K_UP, pygame.K_DOWN)), remote_addr=(host, port))
+    try:
+        await run_net_game(peer, screen)
+    finally:
+        peer.close()
+        pygame.quit()
+    return peer.stats.as_dict()
+
+
+# Проверка сетевой игры на локальной машине без окна: хост и клиент с ИИ обмениваются
+# пакетами через LossyTransport с задержкой и потерями. Возвращает статистику обеих
+# сторон и расхождение состояния клиента с хостом в конце
+async def loopback_test(frames=300, latency=0.05, jitter=0.01, loss=0.1, seed=0):
+    loop = asyncio.get_running_loop()
+    shim = {"latency": latency, "jitter": jitter, "loss": loss}
+    _, host = await loop.create_datagram_endpoint(
+        lambda: NetHost(tracking_controller, dict(shim, seed=seed), random.Random(seed)),
+        local_addr=("127.0.0.1", 0))
+    port = host.transport.transport.get_extra_info("sockname")[1]
+    _, client = await loop.create_datagram_endpoint(
+        lambda: NetClient(tracking_controller, dict(shim, seed=seed + 1)), remote_addr=("127.0.0.1", port))
+    try:
+        await asyncio.gather(run_net_game(host, frames=frames), run_net_game(client, frames=frames))
+        await asyncio.sleep(latency + jitter + 2 / NET_FPS)  # Доставка последних пакетов
+    finally:
+        host.close()
+        client.close()
+    return {
+        "host": host.stats.as_dict(),
+        "client": client.stats.as_dict(),
+        "frames": host.frame,
+        "client_frame_lag": host.frame - client.frame,
+        "score": host.game.score,
+        "paddle_error": abs(host.game.right_paddle.rect.y - client.game.right_paddle.rect.y),
+    }
+
+
+# Основной игровой цикл; завершается при закрытии окна или клавишей Esc
+def main():
+    # Инициализация Pygame и создание окна для отображения игры
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Пинг-Понг")  # Название окна
+    clock = pygame.time.Clock()  # Создание объекта для контроля времени
+    # Создание объекта игры: левая ракетка управляется клавишами W/S, правая - стрелками
+    game = Game(keyboard_controller(pygame.K_w, pygame.K_s), keyboard_controller(pygame.K_UP, pygame.K_DOWN))
+    profiler = frame_stats.profiler  # Замер времени фаз кадра (оверлей - клавиша F3)
+
+    while True:  # Цикл до выхода из игры
+        profiler.frame()
+        for event in pygame.event.get():  # Обработка всех событий
+            if event.type == pygame.QUIT or event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                return  # Выход из игры (окно остается открытым для лаунчера)
+            profiler.handle_event(event)
+        profiler.mark("events")
+
+        game.update()  # Обновление состояния игры (в том числе перемещение ракеток)
+        profiler.mark("update")
+        game.draw(screen)  # Отрисовка всех элементов игры
+        profiler.draw_overlay(screen)
+        profiler.mark("draw")
+
+        pygame.display.flip()  # Обновление содержимого экрана
+        profiler.mark("flip")
+        clock.tick(60)  # Установка частоты кадров (60 FPS)
+
+
+# Запуск из командной строки: игра или режимы simulate, host, join, net-test
+def cli():
+    if sys.argv[1:2] == ["simulate"]:
+        # Пример: python "Game Ping-pong.py" simulate 1000
+        matches = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+        for key, value in run_matches(matches).items():
+            print(f"{key:>15}: {value:,.2f}" if isinstance(value, float) else f"{key:>15}: {value}")
+    elif sys.argv[1:2] == ["host"]:
+        # Пример: python "Game Ping-pong.py" host 50007
+        print(asyncio.run(play_net(port=int(sys.argv[2]) if len(sys.argv) > 2 else NET_PORT)))
+    elif sys.argv[1:2] == ["join"]:
+        # Пример: python "Game Ping-pong.py" join 192.168.0.10 50007
+        print(asyncio.run(play_net(sys.argv[2], int(sys.argv[3]) if len(sys.argv) > 3 else NET_PORT)))
+    elif sys.argv[1:2] == ["net-test"]:
+        # Пример: python "Game Ping-pong.py" net-test 50 0.1 (задержка в мс и доля потерь)
+        latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.05
+        loss = float(sys.argv[3]) if len(sys.argv) > 3 else 0.1
+        for key, value in asyncio.run(loopback_test(latency=latency, loss=loss)).items():
+            print(f"{key:>16}: {value}")
+    else:
+        main()  # Вызов основного игрового цикла
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,829 @@
+import pygame
+import random
+import sys
+import time
+import numpy as np
+from functools import partial
+
+from games import events, frame_stats, sprite_atlas, text_cache
+
+# Константы для экрана, размера игрока, препятствий, дополнительных жизней, монет, алмазов, кадров в секунду и начальных жизней игрока
+SCREEN_WIDTH, SCREEN_HEIGHT = 400, 600
+PLAYER_RADIUS = 20
+OBSTACLE_SIZE = 40
+LIFE_SIZE = 30
+COIN_RADIUS = 10
+DIAMOND_SIZE = 30
+FPS = 10
+LIVES = 3
+POOL_CAP = 256  # Максимальное количество свободных объектов каждого вида в пуле
+
+# Определение цветов в формате RGB
+BLUE = (0, 0, 255)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+YELLOW = (255, 255, 0)
+CYAN = (0, 255, 255)
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+
+# Константы для определения различных состояний игры
+MAIN_MENU = 0
+PAUSE_MENU = 1
+PLAYING = 2
+GAME_OVER_MENU = 3
+
+# Виды падающих объектов в хранилище EntityStore
+OBSTACLE, LIFE, COIN, DIAMOND = range(4)
+
+
+# Базовый класс для всех игровых объектов
+class GameObject:
+    def __init__(self, x, y, width, height, color):
+        # Создаем прямоугольник объекта с заданными координатами, шириной и высотой
+        self.rect = pygame.Rect(x, y, width, height)
+        self.color = color  # Цвет объекта
+
+    def draw(self, screen):
+        # Отрисовка объекта на экране
+        self.paint(screen, self.rect, self.color)
+
+    @staticmethod
+    def paint(surface, rect, color):
+        # Отрисовка фигуры объекта в прямоугольнике rect (также используется для атласа спрайтов)
+        pygame.draw.rect(surface, color, rect)
+
+
+# Хранилище падающих объектов в виде структуры массивов: положение, размер, вид
+# и флаг "жив" лежат в непрерывных массивах NumPy, поэтому движение, удаление
+# ушедших за экран объектов и проверка пересечений выполняются одной операцией
+class EntityStore:
+    def __init__(self, capacity=64):
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.width = np.zeros(capacity, dtype=np.int32)
+        self.height = np.zeros(capacity, dtype=np.int32)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.views = [None] * capacity  # Объекты-представления для каждой занятой записи
+        self.free = list(range(capacity - 1, -1, -1))  # Свободные записи
+        self.recycle = None  # Функция, получающая удаленные объекты (например, EntityPool.release)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+
+    def _grow(self):
+        # Увеличение емкости хранилища вдвое
+        capacity = len(self.alive)
+        for name in ("x", "y", "width", "height", "kind", "alive"):
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate([array, np.zeros_like(array)]))
+        self.views.extend([None] * capacity)
+        self.free.extend(range(2 * capacity - 1, capacity - 1, -1))
+
+    def add(self, view, kind, x, y, width, height):
+        # Добавление объекта; возвращает номер записи
+        if not self.free:
+            self._grow()
+        slot = self.free.pop()
+        self.x[slot], self.y[slot] = x, y
+        self.width[slot], self.height[slot] = width, height
+        self.kind[slot] = kind
+        self.alive[slot] = True
+        self.views[slot] = view
+        return slot
+
+    def remove(self, slot):
+        # Удаление объекта: запись помечается свободной
+        view = self.views[slot]
+        self.alive[slot] = False
+        self.views[slot] = None
+        self.free.append(slot)
+        if self.recycle is not None and view is not None:
+            self.recycle(view)
+
+    def move(self, dy):
+        # Перемещение всех живых объектов по вертикали
+        self.y[self.alive] += dy
+
+    def clear(self):
+        # Удаление всех объектов (записи и объекты-представления остаются для повторного использования)
+        for slot in np.flatnonzero(self.alive):
+            self.remove(slot)
+
+    def cull(self, bottom):
+        # Удаление объектов, верхний край которых ушел ниже bottom
+        for slot in np.flatnonzero(self.alive & (self.y > bottom)):
+            self.remove(slot)
+
+    def of_kind(self, kind):
+        # Живые объекты заданного вида
+        return [self.views[slot] for slot in np.flatnonzero(self.alive & (self.kind == kind))]
+
+    def colliding(self, rect):
+        # Номера записей живых объектов, пересекающихся с прямоугольником rect
+        return np.flatnonzero(self.alive & (self.x < rect.right) & (self.x + self.width > rect.left)
+                              & (self.y < rect.bottom) & (self.y + self.height > rect.top))
+
+
+# Широкая фаза проверки столкновений: равномерная сетка (пространственный хэш)
+# поверх массивов EntityStore. Каждый кадр объекты раскладываются по ячейкам,
+# и точная проверка пересечения выполняется только для объектов из соседних ячеек
+class SpatialHash:
+    def __init__(self, cell_size=64, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        self.cell_size = cell_size
+        self.columns = width // cell_size + 1
+        self.rows = height // cell_size + 1
+        self.store = None
+        self.slots = np.zeros(0, dtype=np.int64)  # Номера записей, упорядоченные по ячейкам
+        self.starts = np.zeros(self.columns * self.rows + 1, dtype=np.int64)  # Начало каждой ячейки в slots
+
+    def _cells(self, x, y, width, height):
+        # Диапазоны ячеек, покрываемых прямоугольниками (объекты за краем экрана попадают в крайние ячейки)
+        size = self.cell_size
+        return (np.clip(x // size, 0, self.columns - 1), np.clip((x + width - 1) // size, 0, self.columns - 1),
+                np.clip(y // size, 0, self.rows - 1), np.clip((y + height - 1) // size, 0, self.rows - 1))
+
+    def rebuild(self, store):
+        # Раскладка всех живых объектов хранилища по ячейкам сетки
+        self.store = store
+        slots = np.flatnonzero(store.alive)
+        x0, x1, y0, y1 = self._cells(store.x[slots], store.y[slots], store.width[slots], store.height[slots])
+        keys, owners = [], []
+        span_x, span_y = x1 - x0, y1 - y0
+        for dx in range(int(span_x.max(initial=0)) + 1):
+            for dy in range(int(span_y.max(initial=0)) + 1):
+                covered = (span_x >= dx) & (span_y >= dy)
+                keys.append((y0[covered] + dy) * self.columns + x0[covered] + dx)
+                owners.append(slots[covered])
+        keys = np.concatenate(keys) if keys else np.zeros(0, dtype=np.int64)
+        order = np.argsort(keys, kind="stable")
+        self.slots = np.concatenate(owners)[order] if owners else keys
+        self.starts = np.searchsorted(keys[order], np.arange(self.columns * self.rows + 1))
+
+    def candidates(self, rect):
+        # Объекты из ячеек, которые покрывает rect (без точной проверки)
+        x0, x1, y0, y1 = (int(value) for value in self._cells(rect.x, rect.y, rect.width, rect.height))
+        parts = [self.slots[self.starts[key]:self.starts[key + 1]]
+                 for y in range(y0, y1 + 1) for key in range(y * self.columns + x0, y * self.columns + x1 + 1)]
+        return np.unique(np.concatenate(parts))
+
+    def query(self, rect):
+        # Номера записей объектов, пересекающихся с rect
+        store = self.store
+        slots = self.candidates(rect)
+        x, y = store.x[slots], store.y[slots]
+        hit = ((x < rect.right) & (x + store.width[slots] > rect.left)
+               & (y < rect.bottom) & (y + store.height[slots] > rect.top))
+        return slots[hit]
+
+    def pairs(self):
+        # Все пары пересекающихся объектов (для столкновений объектов между собой): массив (k, 2)
+        store = self.store
+        found = [np.zeros((0, 2), dtype=np.int64)]
+        counts = np.diff(self.starts)
+        for key in np.flatnonzero(counts > 1):
+            cell = self.slots[self.starts[key]:self.starts[key + 1]]
+            first, second = np.triu_indices(len(cell), 1)
+            a, b = cell[first], cell[second]
+            left, top = np.maximum(store.x[a], store.x[b]), np.maximum(store.y[a], store.y[b])
+            hit = ((left < np.minimum(store.x[a] + store.width[a], store.x[b] + store.width[b]))
+                   & (top < np.minimum(store.y[a] + store.height[a], store.y[b] + store.height[b])))
+            # Пара может встретиться в нескольких ячейках: учитываем ее только в ячейке,
+            # где лежит левый верхний угол области пересечения
+            x0, _, y0, _ = self._cells(left[hit], top[hit], 1, 1)
+            own = y0 * self.columns + x0 == key
+            found.append(np.stack([a[hit][own], b[hit][own]], axis=1))
+        return np.concatenate(found)
+
+
+# Падающий объект: тонкое представление записи в EntityStore
+class Entity(GameObject):
+    kind = None
+
+    def __init__(self, store, x, y, width, height, color):
+        self.store = store
+        self.color = color  # Цвет объекта
+        self._rect = pygame.Rect(x, y, width, height)  # Переиспользуемый прямоугольник для свойства rect
+        self.place(x, y)
+
+    def place(self, x, y):
+        # Добавление объекта в хранилище в заданной позиции (в том числе повторно из пула)
+        self.slot = self.store.add(self, self.kind, x, y, self._rect.width, self._rect.height)
+
+    @property
+    def rect(self):
+        # Прямоугольник объекта с текущей позицией из массивов хранилища
+        self._rect.x = int(self.store.x[self.slot])
+        self._rect.y = int(self.store.y[self.slot])
+        return self._rect
+
+
+# Пул объектов: удаленные из хранилища объекты каждого вида хранятся в списках
+# свободных объектов (не больше cap) и используются повторно при появлении новых
+class EntityPool:
+    def __init__(self, store, cap=POOL_CAP):
+        self.store = store
+        self.cap = cap
+        self.free = {}  # Класс объекта -> список свободных объектов
+        self.hits = 0  # Появления с повторным использованием объекта
+        self.misses = 0  # Появления с созданием нового объекта
+        store.recycle = self.release
+
+    def spawn(self, cls, x, y):
+        # Появление объекта класса cls: повторно используем свободный или создаем новый
+        free = self.free.get(cls)
+        if free:
+            view = free.pop()
+            view.place(x, y)
+            self.hits += 1
+        else:
+            view = cls(self.store, x, y)
+            self.misses += 1
+        return view
+
+    def release(self, view):
+        # Возврат удаленного объекта в пул
+        free = self.free.setdefault(type(view), [])
+        if len(free) < self.cap:
+            free.append(view)
+
+    def stats(self):
+        # Статистика пула: попадания, промахи, доля попаданий и число свободных объектов
+        spawns = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / spawns if spawns else 0.0,
+                "free": sum(len(free) for free in self.free.values())}
+
+
+# Класс игрока, наследуемый от GameObject
+class Player(GameObject):
+    def __init__(self, x, y):
+        # Инициализация игрока с заданной позицией и цветом
+        super().__init__(x, y, PLAYER_RADIUS * 2, PLAYER_RADIUS * 2, BLUE)
+        self.lives = LIVES  # Задание начального количества жизней
+
+    def move(self, dx, dy):
+        # Перемещение игрока по горизонтали и вертикали
+        self.rect.x += dx
+        self.rect.y += dy
+        # Ограничение движения игрока в пределах экрана
+        if self.rect.left < 0:
+            self.rect.left = 0
+        if self.rect.right > SCREEN_WIDTH:
+            self.rect.right = SCREEN_WIDTH
+
+    @staticmethod
+    def paint(surface, rect, color):
+        # Отрисовка игрока в виде синего круга
+        pygame.draw.circle(surface, color, (rect.centerx, rect.centery), PLAYER_RADIUS)
+
+
+# Класс препятствия, наследуемый от Entity
+class Obstacle(Entity):
+    kind = OBSTACLE
+
+    def __init__(self, store, x, y):
+        # Инициализация препятствия с заданной позицией и цветом
+        super().__init__(store, x, y, OBSTACLE_SIZE, OBSTACLE_SIZE, RED)
+
+
+# Класс дополнительных жизней, наследуемый от Entity
+class Life(Entity):
+    kind = LIFE
+
+    def __init__(self, store, x, y):
+        # Инициализация дополнительной жизни с заданной позицией и цветом
+        super().__init__(store, x, y, LIFE_SIZE, LIFE_SIZE, GREEN)
+
+
+# Класс монеты, наследуемый от Entity
+class Coin(Entity):
+    kind = COIN
+
+    def __init__(self, store, x, y):
+        # Инициализация монеты с заданной позицией и цветом
+        super().__init__(store, x, y, COIN_RADIUS * 2, COIN_RADIUS * 2, YELLOW)
+
+    @staticmethod
+    def paint(surface, rect, color):
+        # Отрисовка монеты в виде желтого круга
+        pygame.draw.circle(surface, color, (rect.centerx, rect.centery), COIN_RADIUS)
+
+
+# Класс алмаза, наследуемый от Entity
+class Diamond(Entity):
+    kind = DIAMOND
+
+    def __init__(self, store, x, y):
+        # Инициализация алмаза с заданной позицией и цветом
+        super().__init__(store, x, y, DIAMOND_SIZE, DIAMOND_SIZE, CYAN)
+
+    @staticmethod
+    def paint(surface, rect, color):
+        # Отрисовка алмаза в виде ромба
+        points = [
+            (rect.centerx, rect.top),
+            (rect.right, rect.centery),
+            (rect.centerx, rect.bottom),
+            (rect.left, rect.centery)
+        ]
+        pygame.draw.polygon(surface, color, points)
+
+
+# Среднее количество появлений объектов каждого вида за кадр (раньше - вероятность
+# проверки random.random() на каждом кадре) и размер объекта для выбора положения
+SPAWN_RATES = {OBSTACLE: 0.02, LIFE: 0.01, COIN: 0.03, DIAMOND: 0.005}
+SPAWN_SIZES = {OBSTACLE: OBSTACLE_SIZE, LIFE: LIFE_SIZE, COIN: COIN_RADIUS * 2, DIAMOND: DIAMOND_SIZE}
+
+
+# Планировщик появления объектов: расписание строится заранее по зерну генератора.
+# Для каждого вида интервалы между появлениями берутся из экспоненциального
+# распределения, события всех видов сливаются по времени порциями из генератора.
+# На каждом кадре остается только забрать наступившие события
+class SpawnScheduler:
+    def __init__(self, seed=None, rates=SPAWN_RATES, window=1024):
+        self.rng = np.random.default_rng(seed)
+        self.rates = rates
+        self.window = window  # Длительность одной порции расписания, кадров
+        self.frame = 0  # Номер текущего кадра
+        self.timeline = self._timeline()
+        self.frames, self.kinds, self.xs = next(self.timeline)
+        self.index = 0  # Следующее событие в текущей порции
+
+    def _timeline(self):
+        # Генератор порций расписания: (кадры, виды, положения по горизонтали).
+        # Каждая порция покрывает следующие window кадров; интервалы каждого вида
+        # генерируются только до конца порции, поэтому непрошедшие события (pending)
+        # не накапливаются при бесконечной игре
+        kinds = list(self.rates)
+        last = [0.0] * len(kinds)
+        pending = [np.zeros(0) for _ in kinds]
+        horizon = 0.0
+        while True:
+            horizon += self.window
+            times, kind_ids, xs = [], [], []
+            for i, kind in enumerate(kinds):
+                rate = self.rates[kind]
+                while last[i] <= horizon:
+                    # Интервалы с небольшим запасом; события после horizon остаются до следующей порции
+                    count = int((horizon - last[i]) * rate) + 16
+                    generated = last[i] + np.cumsum(self.rng.exponential(1 / rate, count))
+                    last[i] = generated[-1]
+                    pending[i] = np.concatenate((pending[i], generated))
+                split = np.searchsorted(pending[i], horizon, side="right")
+                due, pending[i] = pending[i][:split], pending[i][split:]
+                times.append(due)
+                kind_ids.append(np.full(len(due), kind, dtype=np.int8))
+                xs.append(self.rng.integers(0, SCREEN_WIDTH - SPAWN_SIZES[kind] + 1, len(due)))
+            times = np.concatenate(times)
+            order = np.argsort(times, kind="stable")
+            yield (np.floor(times[order]).astype(np.int64).tolist(), np.concatenate(kind_ids)[order].tolist(),
+                   np.concatenate(xs)[order].tolist())
+
+    def due(self):
+        # События текущего кадра: список пар (вид, положение по горизонтали)
+        events = []
+        while True:
+            if self.index == len(self.frames):
+                self.frames, self.kinds, self.xs = next(self.timeline)
+                self.index = 0
+                continue
+            if self.frames[self.index] > self.frame:
+                break
+            events.append((self.kinds[self.index], self.xs[self.index]))
+            self.index += 1
+        self.frame += 1
+        return events
+
+
+# Основной класс игры
+class Game:
+    def __init__(self, seed=None):
+        # Инициализация Pygame и создание основных компонентов игры
+        pygame.init()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Game Runner")
+        self.clock = pygame.time.Clock()  # Создание объекта для контроля времени
+        self.font = text_cache.font(None, 55, sysfont=True)  # Задание шрифта для текста (общий реестр шрифтов)
+        self.entities = EntityStore()  # Хранилище препятствий, жизней, монет и алмазов
+        self.grid = SpatialHash()  # Сетка для широкой фазы проверки столкновений
+        self.pool = EntityPool(self.entities)  # Пул для повторного использования объектов
+        self.state = MAIN_MENU  # Текущее состояние игры
+        self.seed = seed  # Зерно расписания появления объектов (None - новое расписание в каждой игре)
+        self.creators = {OBSTACLE: self.create_obstacle, LIFE: self.create_life,
+                         COIN: self.create_coin, DIAMOND: self.create_diamond}
+        # Атлас спрайтов: игрок и все виды объектов отрисовываются один раз при запуске
+        self.atlas = sprite_atlas.SpriteAtlas()
+        self.atlas.add("player", (PLAYER_RADIUS * 2, PLAYER_RADIUS * 2), partial(Player.paint, color=BLUE))
+        for cls, size, color in ((Obstacle, OBSTACLE_SIZE, RED), (Life, LIFE_SIZE, GREEN),
+                                 (Coin, COIN_RADIUS * 2, YELLOW), (Diamond, DIAMOND_SIZE, CYAN)):
+            self.atlas.add(cls.kind, (size, size), partial(cls.paint, color=color))
+        self.running = True  # Флаг основного игрового цикла
+        # Главное меню и меню паузы не меняются, поэтому отрисовываются один раз
+        self.main_menu = self.render_menu([
+            ("Начать игру", SCREEN_HEIGHT // 2 - 100),
+            ("Выйти из игры", SCREEN_HEIGHT // 2 + 50),
+        ])
+        self.pause_menu = self.render_menu([
+            ("Начать новую игру", SCREEN_HEIGHT // 2 - 100),
+            ("Продолжить игру", SCREEN_HEIGHT // 2),
+            ("Выйти из игры", SCREEN_HEIGHT // 2 + 100),
+        ])
+        self.reset()
+
+    # Метод для начала новой игры: сбрасывается только игровое состояние,
+    # а окно, шрифты, меню, часы и хранилище объектов используются повторно
+    def reset(self):
+        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60)  # Создание игрока
+        self.entities.clear()  # Удаление всех объектов (они возвращаются в пул)
+        self.score = 0  # Начальные очки игрока
+        self.spawner = SpawnScheduler(self.seed)  # Расписание появления объектов
+
+    # Метод для перехода в новое состояние; меню отрисовывается один раз при входе
+    def set_state(self, state):
+        self.state = state
+        frame_stats.profiler.skip()  # Время в меню не относится к кадрам игры
+        if state == MAIN_MENU:
+            self.show_menu()
+        elif state == PAUSE_MENU:
+            self.show_pause_menu()
+        elif state == GAME_OVER_MENU:
+            self.show_game_over_menu()
+
+    # Метод для создания нового препятствия
+    def create_obstacle(self, x=None):
+        if x is None:
+            x = random.randint(0, SCREEN_WIDTH - OBSTACLE_SIZE)  # Случайное положение по горизонтали
+        y = -OBSTACLE_SIZE  # Начальная позиция выше верхнего края экрана
+        self.pool.spawn(Obstacle, x, y)  # Добавление нового препятствия в хранилище
+
+    # Метод для создания новой дополнительной жизни
+    def create_life(self, x=None):
+        if x is None:
+            x = random.randint(0, SCREEN_WIDTH - LIFE_SIZE)  # Случайное положение по горизонтали
+        y = -LIFE_SIZE  # Начальная позиция выше верхнего края экрана
+        self.pool.spawn(Life, x, y)  # Добавление новой жизни в хранилище
+
+    # Метод для создания новой монеты
+    def create_coin(self, x=None):
+        if x is None:
+            x = random.randint(0, SCREEN_WIDTH - COIN_RADIUS * 2)  # Случайное положение по горизонтали
+        y = -COIN_RADIUS * 2  # Начальная позиция выше верхнего края экрана
+        self.pool.spawn(Coin, x, y)  # Добавление новой монеты в хранилище
+
+    # Метод для создания нового алмаза
+    def create_diamond(self, x=None):
+        if x is None:
+            x = random.randint(0, SCREEN_WIDTH - DIAMOND_SIZE)  # Случайное положение по горизонтали
+        y = -DIAMOND_SIZE  # Начальная позиция выше верхнего края экрана
+        self.pool.spawn(Diamond, x, y)  # Добавление нового алмаза в хранилище
+
+    # Списки объектов каждого вида (представления записей хранилища)
+    @property
+    def obstacles(self):
+        return self.entities.of_kind(OBSTACLE)
+
+    @property
+    def lives(self):
+        return self.entities.of_kind(LIFE)
+
+    @property
+    def coins(self):
+        return self.entities.of_kind(COIN)
+
+    @property
+    def diamonds(self):
+        return self.entities.of_kind(DIAMOND)
+
+    # Метод для поиска пар пересекающихся между собой объектов (для будущих механик)
+    def entity_collisions(self):
+        self.grid.rebuild(self.entities)
+        return self.grid.pairs()
+
+    # Метод для проверки столкновений игрока с препятствиями, жизнями, монетами и алмазами.
+    # Для единственного запроса (игрок) векторная проверка всех объектов быстрее
+    # построения сетки (см. benchmark_collisions)
+    def check_collisions(self):
+        for slot in self.entities.colliding(self.player.rect):
+            kind = self.entities.kind[slot]
+            if kind == OBSTACLE:
+                self.player.lives -= 1  # Уменьшение количества жизней
+            elif kind == LIFE:
+                self.player.lives += 1  # Увеличение количества жизней
+            elif kind == COIN:
+                self.score += 10  # Увеличение очков
+            elif kind == DIAMOND:
+                self.score += 50  # Увеличение очков
+            self.entities.remove(slot)  # Удаление собранного объекта
+
+    # Метод для обновления состояния игры
+    def update(self):
+        # Перемещение всех объектов вниз и удаление вышедших за нижний край экрана
+        self.entities.move(5)
+        self.entities.cull(SCREEN_HEIGHT)
+
+        self.check_collisions()  # Проверка столкновений
+
+        # Создание объектов, время появления которых наступило по расписанию
+        for kind, x in self.spawner.due():
+            self.creators[kind](x)
+
+    # Метод для отрисовки объектов на экране
+    def draw(self):
+        self.screen.fill(WHITE)  # Заполнение фона белым цветом
+        self.draw_objects()  # Отрисовка игрока и всех объектов
+        self.draw_lives()  # Отрисовка количества жизней
+        self.draw_score()  # Отрисовка текущих очков
+        frame_stats.profiler.draw_overlay(self.screen)  # Оверлей времени кадра (клавиша F3)
+        frame_stats.profiler.mark("draw")
+        pygame.display.flip()  # Обновление экрана
+        frame_stats.profiler.mark("flip")
+
+    # Метод для отрисовки игрока и всех объектов из атласа одним вызовом Surface.blits.
+    # Порядок как раньше: игрок, затем препятствия, жизни, монеты и алмазы
+    def draw_objects(self):
+        store = self.entities
+        slots = np.flatnonzero(store.alive)
+        slots = slots[np.argsort(store.kind[slots], kind="stable")]
+        items = [("player", self.player.rect.topleft)]
+        items.extend(zip(store.kind[slots].tolist(), zip(store.x[slots].tolist(), store.y[slots].tolist())))
+        self.atlas.blits(self.screen, items)
+
+    # Метод для отрисовки количества жизней игрока
+    def draw_lives(self):
+        lives_text = text_cache.render(self.font, f'Жизни: {self.player.lives}', BLACK)  # Текст с количеством жизней (из кэша, если не изменился)
+        self.screen.blit(lives_text, (10, 10))  # Отображение текста в левом верхнем углу
+
+    # Метод для отрисовки текущих очков
+    def draw_score(self):
+        score_text = text_cache.render(self.font, f'Очки: {self.score}', BLACK)  # Текст с текущими очками (из кэша, если не изменился)
+        self.screen.blit(score_text, (SCREEN_WIDTH - 200, 10))  # Отображение текста в правом верхнем углу
+
+    # Метод для предварительной отрисовки меню на отдельную поверхность.
+    # Возвращает поверхность и прямоугольники пунктов для проверки нажатий мышью
+    def render_menu(self, items):
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        surface.fill(BLACK)  # Заполнение фона черным цветом
+        rects = []
+        for text, y in items:
+            text_surface = text_cache.render(self.font, text, WHITE)
+            surface.blit(text_surface, (SCREEN_WIDTH // 2 - text_surface.get_width() // 2, y))
+            rects.append(pygame.Rect(SCREEN_WIDTH // 2 - 100, y, 200, 50))  # Область нажатия пункта
+        return surface, rects
+
+    # Метод для вывода готового меню на экран
+    def show(self, menu):
+        self.screen.blit(menu[0], (0, 0))
+        pygame.display.flip()  # Обновление экрана
+
+    # Метод для отображения главного меню
+    def show_menu(self):
+        self.show(self.main_menu)
+
+    # Метод для отображения меню паузы
+    def show_pause_menu(self):
+        self.show(self.pause_menu)
+
+    # Метод для отображения меню окончания игры (очки известны только в конце игры)
+    def show_game_over_menu(self):
+        text_y = SCREEN_HEIGHT // 2 - 50  # Расположение текста на экране
+        self.game_over_menu = self.render_menu([
+            ("Конец игры", text_y - 150),
+            (f'Ваши очки: {self.score}', text_y - 50),
+            ("Начать новую игру", text_y + 50),
+            ("Завершить игру", text_y + 100),
+        ])
+        self.show(self.game_over_menu)
+
+    # Основной игровой цикл: конечный автомат по состояниям игры
+    def run(self):
+        self.running = True
+        self.set_state(MAIN_MENU)  # Отображение главного меню перед началом игры
+        while self.running:
+            if self.state == MAIN_MENU:
+                self._run_main_menu()
+            elif self.state == PLAYING:
+                self._run_playing()
+            elif self.state == PAUSE_MENU:
+                self._run_pause_menu()
+            elif self.state == GAME_OVER_MENU:
+                self._run_game_over_menu()
+
+    # Метод для обработки главного меню
+    def _run_main_menu(self):
+        for event in events.wait():
+            if event.type == pygame.QUIT:
+                self.running = False
+                return
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.show_menu()  # Восстановление перекрытого окна
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1:  # Левая кнопка мыши
+                    start_rect, quit_rect = self.main_menu[1]
+                    # Проверка нажатий на элементы меню
+                    if start_rect.collidepoint(event.pos):
+                        self.state = PLAYING
+                        return
+                    elif quit_rect.collidepoint(event.pos):
+                        self.running = False
+                        return
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_RETURN:
+                    self.state = PLAYING
+                    return
+                elif event.key == pygame.K_ESCAPE:
+                    self.running = False
+                    return
+
+    # Метод для одного кадра игрового процесса
+    def _run_playing(self):
+        profiler = frame_stats.profiler  # Замер времени фаз кадра (оверлей - клавиша F3)
+        profiler.frame()
+        self.clock.tick(FPS)  # Ограничение количества кадров в секунду
+        profiler.mark("wait")
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+                return
+            elif profiler.handle_event(event):
+                continue
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    self.set_state(PAUSE_MENU)  # Переход в меню паузы
+                    return
+
+        keys = pygame.key.get_pressed()
+        # Обработка нажатий клавиш для движения игрока
+        if keys[pygame.K_LEFT]:
+            self.player.move(-5, 0)
+        if keys[pygame.K_RIGHT]:
+            self.player.move(5, 0)
+        profiler.mark("events")
+
+        self.update()  # Обновление состояния игры
+        profiler.mark("update")
+        self.draw()  # Отрисовка объектов на экране
+
+        # Проверка количества жизней игрока
+        if self.player.lives <= 0:
+            self.set_state(GAME_OVER_MENU)
+
+    # Метод для обработки меню паузы
+    def _run_pause_menu(self):
+        for event in events.wait():
+            if event.type == pygame.QUIT:
+                self.running = False
+                return
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.show_pause_menu()  # Восстановление перекрытого окна
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1:  # Левая кнопка мыши
+                    new_game_rect, continue_rect, quit_rect = self.pause_menu[1]
+                    # Проверка нажатий на элементы меню паузы
+                    if new_game_rect.collidepoint(event.pos):
+                        self.reset()
+                        self.state = PLAYING
+                        return
+                    elif continue_rect.collidepoint(event.pos):
+                        self.state = PLAYING
+                        return
+                    elif quit_rect.collidepoint(event.pos):
+                        self.running = False
+                        return
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_RETURN:
+                    self.reset()
+                    self.state = PLAYING
+                    return
+                elif event.key == pygame.K_c:
+                    self.state = PLAYING
+                    return
+                elif event.key == pygame.K_q:
+                    self.running = False
+                    return
+
+    # Метод для обработки меню окончания игры
+    def _run_game_over_menu(self):
+        for event in events.wait():
+            if event.type == pygame.QUIT:
+                self.running = False
+                return
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.show(self.game_over_menu)  # Восстановление перекрытого окна
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1:  # Левая кнопка мыши
+                    new_game_rect, quit_rect = self.game_over_menu[1][2:]
+                    # Проверка нажатий на элементы меню окончания игры
+                    if new_game_rect.collidepoint(event.pos):
+                        self.reset()
+                        self.state = PLAYING
+                        return
+                    elif quit_rect.collidepoint(event.pos):
+                        self.running = False
+                        return
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_RETURN:
+                    self.reset()
+                    self.state = PLAYING
+                    return
+                elif event.key == pygame.K_q:
+                    self.running = False
+                    return
+
+
+# Бенчмарк проверки столкновений с игроком: перебор списка pygame.Rect (как раньше),
+# векторный перебор всех объектов и пространственный хэш; для хэша также
+# измеряется поиск всех пар пересекающихся объектов
+def benchmark_collisions(counts=(10, 1000, 10000), frames=200, seed=0):
+    rng = np.random.default_rng(seed)
+    sizes = {OBSTACLE: OBSTACLE_SIZE, LIFE: LIFE_SIZE, COIN: COIN_RADIUS * 2, DIAMOND: DIAMOND_SIZE}
+    player = pygame.Rect(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60, PLAYER_RADIUS * 2, PLAYER_RADIUS * 2)
+    print(f"{'объектов':>9} {'Rect-список, мс':>16} {'векторно, мс':>13} {'хэш, мс':>8} {'хэш + пары, мс':>15} {'пар':>6}")
+    for count in counts:
+        store = EntityStore()
+        for kind in rng.integers(0, 4, count):
+            size = sizes[int(kind)]
+            store.add(None, int(kind), int(rng.integers(0, SCREEN_WIDTH - size)), int(rng.integers(-size, SCREEN_HEIGHT)), size, size)
+        rects = [pygame.Rect(int(store.x[i]), int(store.y[i]), int(store.width[i]), int(store.height[i]))
+                 for i in np.flatnonzero(store.alive)]
+        grid = SpatialHash()
+        timings = []
+        for check in (
+            lambda: [rect for rect in rects if player.colliderect(rect)],
+            lambda: store.colliding(player),
+            lambda: (grid.rebuild(store), grid.query(player)),
+            lambda: (grid.rebuild(store), grid.query(player), grid.pairs()),
+        ):
+            start = time.perf_counter()
+            for _ in range(frames):
+                check()
+            timings.append((time.perf_counter() - start) / frames * 1000)
+        print(f"{count:>9} {timings[0]:>16.3f} {timings[1]:>13.3f} {timings[2]:>8.3f} {timings[3]:>15.3f} {len(grid.pairs()):>6}")
+
+
+# Бенчмарк отрисовки кадра: отдельный вызов pygame.draw для каждого объекта (как раньше)
+# и вывод всех объектов из атласа спрайтов одним вызовом Surface.blits
+def benchmark_draw(counts=(100, 1000, 10000), frames=30, seed=0):
+    game = Game()
+    rng = random.Random(seed)
+    print(f"{'объектов':>9} {'pygame.draw, мс':>16} {'атлас + blits, мс':>18} {'ускорение':>10}")
+    for count in counts:
+        game.reset()
+        for _ in range(count):
+            cls = rng.choice((Obstacle, Life, Coin, Diamond))
+            game.pool.spawn(cls, rng.randint(0, SCREEN_WIDTH - 40), rng.randint(-40, SCREEN_HEIGHT))
+        views = [view for view in game.entities.views if view is not None]
+        timings = []
+        for draw in (
+            lambda: [view.draw(game.screen) for view in [game.player] + views],
+            game.draw_objects,
+        ):
+            start = time.perf_counter()
+            for _ in range(frames):
+                game.screen.fill(WHITE)
+                draw()
+            timings.append((time.perf_counter() - start) / frames * 1000)
+        print(f"{count:>9} {timings[0]:>16.3f} {timings[1]:>18.3f} {timings[0] / timings[1]:>9.1f}x")
+
+
+# Сравнение затрат на кадр: четыре вызова random.random() и выборка событий из расписания
+def benchmark_spawn(frames=1_000_000, seed=0):
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    spawned = 0
+    for _ in range(frames):
+        for rate in SPAWN_RATES.values():
+            if rng.random() < rate:
+                spawned += 1
+    per_frame = (time.perf_counter() - start) / frames * 1e9
+    print(f"random.random() на каждом кадре: {per_frame:.0f} нс/кадр, объектов: {spawned}")
+    spawner = SpawnScheduler(seed)
+    start = time.perf_counter()
+    spawned = 0
+    for _ in range(frames):
+        spawned += len(spawner.due())
+    per_frame = (time.perf_counter() - start) / frames * 1e9
+    print(f"расписание SpawnScheduler:       {per_frame:.0f} нс/кадр, объектов: {spawned}")
+
+
+# Основной игровой цикл; завершается при выходе из игры через меню или при закрытии окна
+def main(seed=None):
+    game = Game(seed)
+    game.run()
+
+
+# Запуск из командной строки: игра (необязательный аргумент - зерно) или режимы bench, bench-draw, bench-spawn
+def cli():
+    if sys.argv[1:2] == ["bench"]:
+        benchmark_collisions()
+    elif sys.argv[1:2] == ["bench-draw"]:
+        benchmark_draw()
+    elif sys.argv[1:2] == ["bench-spawn"]:
+        benchmark_spawn()
+    else:
+        # Необязательный аргумент - зерно расписания появления объектов для повторяемых игр
+        main(int(sys.argv[1]) if sys.argv[1:2] and sys.argv[1].isdigit() else None)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,484 @@
+import pygame
+import random
+from collections import deque
+
+from games import events, frame_stats, text_cache
+
+try:
+    import numpy as np  # NumPy нужен только для SnakeBatchEnv
+except ImportError:
+    np = None
+
+# Константы для определения различных состояний игры
+MAIN_MENU = 0
+PAUSE_MENU = 1
+PLAYING = 2
+GAME_OVER_MENU = 3
+
+# Смещение головы змейки в клетках для каждого направления
+DIRECTIONS = {'UP': (0, -1), 'DOWN': (0, 1), 'LEFT': (-1, 0), 'RIGHT': (1, 0)}
+
+
+# Класс Settings отвечает за хранение настроек игры
+class Settings:
+    def __init__(self):
+        self.screen_width = 800  # Ширина экрана
+        self.screen_height = 600  # Высота экрана
+        self.bg_color = (0, 0, 0)  # Цвет фона (черный)
+        self.snake_color = (0, 255, 0)  # Цвет змейки (зеленый)
+        self.food_color = (255, 0, 0)  # Цвет еды (красный)
+        self.segment_size = 20  # Размер сегмента змейки
+        self.fps = 15  # Частота кадров
+
+
+# Класс FreeCells хранит множество свободных клеток поля с добавлением, удалением
+# и случайным выбором за O(1): массив клеток и словарь "клетка -> позиция в массиве"
+class FreeCells:
+    def __init__(self, columns, rows):
+        self.cells = [(x, y) for y in range(rows) for x in range(columns)]
+        self.index = {cell: i for i, cell in enumerate(self.cells)}
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __contains__(self, cell):
+        return cell in self.index
+
+    def add(self, cell):
+        # Клетка освободилась: добавляем ее в конец массива
+        if cell not in self.index:
+            self.index[cell] = len(self.cells)
+            self.cells.append(cell)
+
+    def remove(self, cell):
+        # Клетка занята: на ее место в массиве переносим последнюю клетку
+        i = self.index.pop(cell, None)
+        if i is None:
+            return
+        last = self.cells.pop()
+        if i < len(self.cells):
+            self.cells[i] = last
+            self.index[last] = i
+
+    def sample(self):
+        # Случайная свободная клетка (равновероятно)
+        return self.cells[random.randrange(len(self.cells))]
+
+
+# Класс Snake отвечает за управление змейкой
+class Snake:
+    def __init__(self, settings):
+        self.settings = settings
+        self.columns = settings.screen_width // settings.segment_size  # Размер поля в клетках
+        self.rows = settings.screen_height // settings.segment_size
+        # Изначально змейка состоит из одного сегмента, расположенного в центре экрана.
+        # Тело хранится как очередь клеток (голова слева) и множество занятых клеток
+        head = (settings.screen_width // 2 // settings.segment_size, settings.screen_height // 2 // settings.segment_size)
+        self.body = deque([head])
+        self.occupied = {head}
+        self.free = FreeCells(self.columns, self.rows)  # Свободные клетки поля, синхронизированы с телом
+        self.free.remove(head)
+        self.direction = 'RIGHT'  # Начальное направление движения змейки
+        self.grow = False  # Флаг, указывающий на необходимость увеличения змейки
+        self.collided = False  # Флаг столкновения головы с телом на последнем шаге
+        self.vacated = None  # Клетка, освобожденная хвостом на последнем шаге
+
+    @property
+    def head(self):
+        # Клетка головы змейки
+        return self.body[0]
+
+    def update(self):
+        # Новая голова в соседней клетке по направлению движения
+        dx, dy = DIRECTIONS[self.direction]
+        head = self._wrap_around_screen(self.body[0][0] + dx, self.body[0][1] + dy)
+
+        # Освобождаем клетку хвоста, если змейка не растет на этом шаге
+        self.vacated = None
+        if self.grow:
+            self.grow = False
+        else:
+            tail = self.vacated = self.body.pop()
+            self.occupied.discard(tail)
+            self.free.add(tail)
+
+        # Проверяем столкновения
+        self.collided = head in self.occupied
+        self.body.appendleft(head)
+        self.occupied.add(head)
+        self.free.remove(head)
+
+    def change_direction(self, direction):
+        # Избегаем движения в противоположную сторону
+        opposite_directions = {'UP': 'DOWN', 'DOWN': 'UP', 'LEFT': 'RIGHT', 'RIGHT': 'LEFT'}
+        if direction != opposite_directions[self.direction]:
+            self.direction = direction
+
+    def draw(self, screen):
+        # Отрисовываем каждый сегмент змейки
+        for cell in self.body:
+            pygame.draw.rect(screen, self.settings.snake_color, self.cell_rect(cell))
+
+    def cell_rect(self, cell):
+        # Прямоугольник клетки поля на экране
+        size = self.settings.segment_size
+        return pygame.Rect(cell[0] * size, cell[1] * size, size, size)
+
+    def grow_snake(self):
+        # Устанавливаем флаг увеличения змейки
+        self.grow = True
+
+    def _check_collisions(self):
+        # Столкновение головы змейки с ее телом определяется при перемещении в update
+        return self.collided
+
+    def _wrap_around_screen(self, x, y):
+        # Перемещаем змейку на противоположную сторону экрана при выходе за границы
+        return x % self.columns, y % self.rows
+
+
+# Класс Food отвечает за управление едой
+class Food:
+    def __init__(self, settings, snake):
+        self.settings = settings
+        self.rect = pygame.Rect(0, 0, settings.segment_size, settings.segment_size)
+        self.snake = snake
+        self._place_food()  # Размещаем еду на случайной позиции
+
+    def _place_food(self):
+        # Размещаем еду в случайной свободной клетке (не на теле змейки)
+        if not self.snake.free:
+            return  # Змейка заняла все поле
+        x, y = self.snake.free.sample()
+        self.rect.x = x * self.settings.segment_size
+        self.rect.y = y * self.settings.segment_size
+
+    def update(self, snake):
+        # Проверяем, съела ли змейка еду
+        size = self.settings.segment_size
+        if snake.head == (self.rect.x // size, self.rect.y // size):
+            snake.grow_snake()  # Увеличиваем змейку
+            self._place_food()  # Размещаем новую еду
+
+    def draw(self, screen):
+        # Отрисовываем еду
+        pygame.draw.rect(screen, self.settings.food_color, self.rect)
+
+
+# Класс Menu отвечает за отображение и обработку меню
+class Menu:
+    def __init__(self, screen, options, font_size=36):
+        self.screen = screen
+        self.options = options
+        self.font = text_cache.font(None, font_size)  # Общий реестр шрифтов
+        self.selected_option = 0
+        self.dirty = True  # Меню нужно перерисовать
+        # Пункты меню отрисовываются один раз в двух цветах: обычном и выбранном
+        self.surfaces = []
+        self.rects = []  # Прямоугольники пунктов для проверки нажатий мышью
+        for i, option in enumerate(options):
+            normal = text_cache.render(self.font, option, (100, 100, 100))
+            selected = text_cache.render(self.font, option, (255, 255, 255))
+            self.surfaces.append((normal, selected))
+            self.rects.append(selected.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2 + i * 50)))
+
+    def draw(self):
+        # Отрисовываем меню на экране, только если оно изменилось
+        if not self.dirty:
+            return
+        self.screen.fill((0, 0, 0))
+        for i, (normal, selected) in enumerate(self.surfaces):
+            self.screen.blit(selected if i == self.selected_option else normal, self.rects[i])
+        pygame.display.flip()
+        self.dirty = False
+
+    def handle_event(self, event):
+        # Обрабатываем события в меню
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_UP:
+                self.selected_option = (self.selected_option - 1) % len(self.options)
+                self.dirty = True
+            elif event.key == pygame.K_DOWN:
+                self.selected_option = (self.selected_option + 1) % len(self.options)
+                self.dirty = True
+            elif event.key == pygame.K_RETURN:
+                return self.selected_option
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            for i, rect in enumerate(self.rects):
+                if rect.collidepoint(event.pos):
+                    return i
+        elif event.type == pygame.WINDOWEXPOSED:
+            self.dirty = True  # Окно было перекрыто: содержимое нужно восстановить
+        return None
+
+
+# Класс Game отвечает за управление игрой
+class Game:
+    def __init__(self):
+        pygame.init()
+        self.settings = Settings()
+        self.screen = pygame.display.set_mode((self.settings.screen_width, self.settings.screen_height))
+        pygame.display.set_caption("Snake Game")
+
+        self.snake = Snake(self.settings)
+        self.food = Food(self.settings, self.snake)
+        self.clock = pygame.time.Clock()
+        self.state = MAIN_MENU
+
+        self.main_menu = Menu(self.screen, ["Start Game", "Quit"])
+        self.pause_menu = Menu(self.screen, ["New Game", "Continue", "Quit"])
+        self.game_over_menu = Menu(self.screen, ["New Game", "Quit"])
+        self.full_redraw = True  # Следующий кадр игры нужно перерисовать целиком
+        self.drawn_food = None  # Положение еды на экране в прошлом кадре
+
+    def run_game(self):
+        # Основной игровой цикл; завершается при выходе из игры через меню или при закрытии окна
+        shown_state = None
+        self.running = True
+        while self.running:
+            if self.state != shown_state:
+                # При входе в меню его нужно отрисовать заново поверх игры
+                for menu in (self.main_menu, self.pause_menu, self.game_over_menu):
+                    menu.dirty = True
+                self.full_redraw = True  # Экран игры после меню перерисовывается целиком
+                frame_stats.profiler.skip()  # Время в меню не относится к кадрам игры
+                shown_state = self.state
+            if self.state == MAIN_MENU:
+                self._run_main_menu()
+            elif self.state == PLAYING:
+                self._run_playing()
+            elif self.state == PAUSE_MENU:
+                self._run_pause_menu()
+            elif self.state == GAME_OVER_MENU:
+                self._run_game_over_menu()
+
+    def _run_main_menu(self):
+        # Запуск главного меню
+        self.main_menu.draw()
+        for event in events.wait():
+            if event.type == pygame.QUIT:
+                self.running = False
+                return
+            selected_option = self.main_menu.handle_event(event)
+            if selected_option is not None:
+                if selected_option == 0:  # Start Game
+                    self.snake = Snake(self.settings)
+                    self.food = Food(self.settings, self.snake)
+                    self.state = PLAYING
+                elif selected_option == 1:  # Quit
+                    self.running = False
+                    return
+
+    def _run_pause_menu(self):
+        # Запуск меню паузы
+        self.pause_menu.draw()
+        for event in events.wait():
+            if event.type == pygame.QUIT:
+                self.running = False
+                return
+            selected_option = self.pause_menu.handle_event(event)
+            if selected_option is not None:
+                if selected_option == 0:  # New Game
+                    self.snake = Snake(self.settings)
+                    self.food = Food(self.settings, self.snake)
+                    self.state = PLAYING
+                elif selected_option == 1:  # Continue
+                    self.state = PLAYING
+                elif selected_option == 2:  # Quit
+                    self.running = False
+                    return
+
+    def _run_game_over_menu(self):
+        # Запуск меню при окончании игры
+        self.game_over_menu.draw()
+        for event in events.wait():
+            if event.type == pygame.QUIT:
+                self.running = False
+                return
+            selected_option = self.game_over_menu.handle_event(event)
+            if selected_option is not None:
+                if selected_option == 0:  # New Game
+                    self.snake = Snake(self.settings)
+                    self.food = Food(self.settings, self.snake)
+                    self.state = PLAYING
+                elif selected_option == 1:  # Quit
+                    self.running = False
+                    return
+
+    def _run_playing(self):
+        # Запуск игрового процесса
+        profiler = frame_stats.profiler  # Замер времени фаз кадра (оверлей - клавиша F3)
+        profiler.frame()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+                return
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESIZED) or profiler.handle_event(event):
+                self.full_redraw = True  # Содержимое окна нужно восстановить (или показать/скрыть оверлей)
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    self.state = PAUSE_MENU
+                else:
+                    self._check_keydown_events(event)
+        profiler.mark("events")
+
+        self.snake.update()
+        self.food.update(self.snake)
+        if self.snake._check_collisions():
+            self.state = GAME_OVER_MENU
+        profiler.mark("update")
+
+        self._update_screen()
+        self.clock.tick(self.settings.fps)
+
+    def _check_keydown_events(self, event):
+        # Обрабатываем нажатия клавиш для изменения направления движения змейки
+        if event.key == pygame.K_UP:
+            self.snake.change_direction('UP')
+        elif event.key == pygame.K_DOWN:
+            self.snake.change_direction('DOWN')
+        elif event.key == pygame.K_LEFT:
+            self.snake.change_direction('LEFT')
+        elif event.key == pygame.K_RIGHT:
+            self.snake.change_direction('RIGHT')
+
+    def _update_screen(self):
+        # Обновляем содержимое экрана
+        if self.full_redraw:
+            self.screen.fill(self.settings.bg_color)
+            self.snake.draw(self.screen)
+            self.food.draw(self.screen)
+            frame_stats.profiler.draw_overlay(self.screen)
+            frame_stats.profiler.mark("draw")
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            # За шаг меняются только клетки новой головы, освобожденного хвоста и еды
+            dirty = []
+            tail = self.snake.vacated
+            if tail is not None and tail not in self.snake.occupied:
+                dirty.append(self.screen.fill(self.settings.bg_color, self.snake.cell_rect(tail)))
+            dirty.append(pygame.draw.rect(self.screen, self.settings.snake_color, self.snake.cell_rect(self.snake.head)))
+            if self.food.rect != self.drawn_food:
+                size = self.settings.segment_size
+                if (self.drawn_food.x // size, self.drawn_food.y // size) not in self.snake.occupied:
+                    dirty.append(self.screen.fill(self.settings.bg_color, self.drawn_food))
+                self.food.draw(self.screen)
+                dirty.append(self.food.rect.copy())
+            overlay = frame_stats.profiler.draw_overlay(self.screen)
+            if overlay is not None:
+                dirty.append(overlay)
+            frame_stats.profiler.mark("draw")
+            pygame.display.update(dirty)
+        frame_stats.profiler.mark("flip")
+        self.drawn_food = self.food.rect.copy()
+
+
+# Класс SnakeBatchEnv одновременно моделирует N независимых игр без окна
+# по тем же правилам, что Snake.update, Food.update и Snake.change_direction.
+# Клетка поля кодируется числом y * columns + x, тело каждой змейки хранится
+# в кольцевом буфере, занятые клетки - в булевом массиве
+class SnakeBatchEnv:
+    ACTIONS = ('UP', 'DOWN', 'LEFT', 'RIGHT')  # Действие - индекс направления в этом кортеже
+
+    def __init__(self, num_envs, settings=None, seed=None):
+        if np is None:
+            raise ImportError("Для SnakeBatchEnv нужна библиотека NumPy: pip install numpy")
+        settings = settings or Settings()
+        self.num_envs = num_envs
+        self.columns = settings.screen_width // settings.segment_size  # Размер поля в клетках
+        self.rows = settings.screen_height // settings.segment_size
+        self.cells = self.columns * self.rows
+        self.start_cell = (settings.screen_height // 2 // settings.segment_size) * self.columns \
+            + settings.screen_width // 2 // settings.segment_size  # Клетка появления змейки (центр экрана)
+        self.rng = np.random.default_rng(seed)
+
+        self.dx = np.array([DIRECTIONS[d][0] for d in self.ACTIONS])
+        self.dy = np.array([DIRECTIONS[d][1] for d in self.ACTIONS])
+        self.opposite = np.array([1, 0, 3, 2])  # Индекс противоположного направления
+
+        self.index = np.arange(num_envs)
+        self.body = np.zeros((num_envs, self.cells), dtype=np.int64)  # Кольцевой буфер клеток тела
+        self.head_index = np.zeros(num_envs, dtype=np.int64)  # Позиция головы в буфере
+        self.length = np.ones(num_envs, dtype=np.int64)
+        self.occupied = np.zeros((num_envs, self.cells), dtype=bool)
+        self.direction = np.zeros(num_envs, dtype=np.int64)
+        self.grow = np.zeros(num_envs, dtype=bool)
+        self.food = np.zeros(num_envs, dtype=np.int64)
+        self.reset()
+
+    def reset(self, mask=None):
+        # Новая игра во всех окружениях или только в отмеченных маской
+        envs = self.index if mask is None else np.flatnonzero(mask)
+        if len(envs):
+            self.occupied[envs] = False
+            self.occupied[envs, self.start_cell] = True
+            self.body[envs, 0] = self.start_cell
+            self.head_index[envs] = 0
+            self.length[envs] = 1
+            self.direction[envs] = self.ACTIONS.index('RIGHT')  # Начальное направление движения змейки
+            self.grow[envs] = False
+            self._place_food(envs)
+        return self.observe()
+
+    def step(self, actions):
+        # Один шаг всех игр; возвращает (наблюдения, награды, флаги окончания игры).
+        # Закончившиеся игры сразу начинаются заново
+        index = self.index
+        actions = np.asarray(actions, dtype=np.int64)
+        # Избегаем движения в противоположную сторону
+        self.direction = np.where(actions != self.opposite[self.direction], actions, self.direction)
+
+        # Новая голова в соседней клетке с переходом через край экрана
+        head = self.body[index, self.head_index]
+        x = (head % self.columns + self.dx[self.direction]) % self.columns
+        y = (head // self.columns + self.dy[self.direction]) % self.rows
+        new_head = y * self.columns + x
+
+        # Освобождаем клетку хвоста, если змейка не растет на этом шаге
+        move = ~self.grow
+        tail = self.body[index, (self.head_index - self.length + 1) % self.cells]
+        self.occupied[index[move], tail[move]] = False
+        self.length += self.grow
+        self.grow[:] = False
+
+        # Столкновение головы с телом и перемещение головы
+        collided = self.occupied[index, new_head]
+        self.head_index = (self.head_index + 1) % self.cells
+        self.body[index, self.head_index] = new_head
+        self.occupied[index, new_head] = True
+
+        # Еда увеличивает змейку на следующем шаге
+        eaten = (new_head == self.food) & ~collided
+        self.grow = eaten
+        dones = collided | (self.length == self.cells)
+        rewards = eaten.astype(np.float32) - collided
+        self._place_food(np.flatnonzero(eaten & ~dones))
+        self.reset(dones)
+        return self.observe(), rewards, dones
+
+    def observe(self):
+        # Наблюдения: массив (N, 3, rows, columns) с плоскостями тела, головы и еды
+        index = self.index
+        obs = np.zeros((self.num_envs, 3, self.cells), dtype=np.uint8)
+        obs[:, 0] = self.occupied
+        obs[index, 1, self.body[index, self.head_index]] = 1
+        obs[index, 2, self.food] = 1
+        return obs.reshape(self.num_envs, 3, self.rows, self.columns)
+
+    def _place_food(self, envs):
+        # Размещаем еду в случайной свободной клетке каждого из окружений envs
+        if len(envs):
+            scores = self.rng.random((len(envs), self.cells))
+            scores[self.occupied[envs]] = -1.0
+            self.food[envs] = scores.argmax(axis=1)
+
+
+# Точка входа в программу
+def main():
+    game = Game()
+    game.run_game()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+import pygame
+
+
+# Атлас спрайтов: фигуры, которые игры рисовали через pygame.draw на каждом кадре,
+# отрисовываются один раз на общую поверхность. Кадр затем выводится одним вызовом
+# Surface.blits с областями атласа. Сплошные фигуры без сглаживания используют
+# прозрачный цвет (colorkey) с RLE-ускорением - такой вывод в несколько раз быстрее
+# попиксельной прозрачности; для сглаженных спрайтов нужен alpha=True
+class SpriteAtlas:
+    COLORKEY = (255, 0, 255)  # Прозрачный цвет атласа без попиксельной прозрачности
+
+    def __init__(self, alpha=False):
+        self.alpha = alpha  # Попиксельная прозрачность вместо прозрачного цвета
+        self.sprites = []  # (имя, размер, функция рисования) в порядке добавления
+        self.areas = {}  # Имя спрайта -> область на поверхности атласа
+        self.surface = None  # Поверхность атласа; собирается при первом использовании
+
+    def add(self, name, size, painter):
+        # Добавление спрайта: painter(surface, rect) рисует фигуру в прямоугольнике rect
+        # размером size (как pygame.draw рисовал бы ее в прямоугольнике объекта)
+        self.sprites.append((name, size, painter))
+        self.surface = None
+
+    def build(self):
+        # Сборка атласа: спрайты располагаются в одну строку. Каждая область на пиксель
+        # больше объекта, так как pygame.draw закрашивает и правую/нижнюю границу
+        width = sum(size[0] + 1 for _, size, _ in self.sprites)
+        height = max((size[1] + 1 for _, size, _ in self.sprites), default=1)
+        if self.alpha:
+            surface = pygame.Surface((max(width, 1), height), pygame.SRCALPHA)
+        else:
+            surface = pygame.Surface((max(width, 1), height))
+            surface.fill(self.COLORKEY)
+        x = 0
+        for name, (sprite_width, sprite_height), painter in self.sprites:
+            area = pygame.Rect(x, 0, sprite_width + 1, sprite_height + 1)
+            painter(surface.subsurface(area), pygame.Rect(0, 0, sprite_width, sprite_height))
+            self.areas[name] = area
+            x += area.width
+        if pygame.display.get_surface() is not None:
+            # Формат экрана, чтобы вывод не требовал преобразования пикселей
+            surface = surface.convert_alpha() if self.alpha else surface.convert()
+        if not self.alpha:
+            surface.set_colorkey(self.COLORKEY, pygame.RLEACCEL)
+        self.surface = surface
+        return surface
+
+    def blit(self, screen, name, position):
+        # Вывод одного спрайта
+        if self.surface is None:
+            self.build()
+        screen.blit(self.surface, position, self.areas[name])
+
+    def blits(self, screen, items):
+        # Вывод всех спрайтов кадра одним вызовом; items - пары (имя, позиция)
+        if self.surface is None:
+            self.build()
+        surface, areas = self.surface, self.areas
+        screen.blits([(surface, position, areas[name]) for name, position in items], False)
@@ -0,0 +1,671 @@
+import pygame
+import sys
+import random
+import time
+import os
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from games import frame_stats, text_cache
+
+
+# Основной файл игры Tetris
+class Game:
+    def __init__(self, screen, board_cls=None, rng=None, policy_rng=None):
+        self.screen = screen  # Для игры без окна (симуляции) screen может быть None
+        self.rng = rng or random  # Генератор фигур: по умолчанию глобальный модуль random
+        # Отдельный генератор для стратегий симуляции: последовательность фигур не зависит от стратегии
+        self.policy_rng = policy_rng or random.Random()
+        board_cls = board_cls or Board  # Реализация поля: Board (список списков) или BitBoard (битовые маски)
+        self.board = board_cls(10, 20)  # Инициализация игрового поля размером 10x20
+        self.piece = self.new_piece()  # Создание текущей фигуры
+        self.next_piece = self.new_piece()  # Создание следующей фигуры
+        self.drop_time = 0  # Таймер для автоматического падения фигур
+        self.game_over = False  # Флаг окончания игры
+        self.lines = 0  # Количество очищенных линий
+        self.pieces = 0  # Количество зафиксированных фигур
+        self.last_piece_rect = None  # Область фигуры на экране в прошлом кадре (None - нужна полная перерисовка)
+        self.last_state = None  # Поворот фигуры в прошлом кадре
+
+    def new_piece(self):
+        # Создание новой фигуры с помощью генератора случайных чисел игры
+        return Piece(self.board, self.rng.randrange(len(SHAPES)))
+
+    def lock_piece(self):
+        # Фиксация текущей фигуры на поле и переход к следующей
+        self.lines += self.board.place_piece(self.piece)  # Размещение фигуры на доске
+        self.pieces += 1
+        self.piece = self.next_piece  # Переключение на следующую фигуру
+        self.next_piece = self.new_piece()  # Создание новой следующей фигуры
+        if not self.board.fits(self.piece):  # Проверка позиции новой фигуры
+            self.game_over = True  # Если новая фигура не может разместиться, игра окончена
+
+    def handle_event(self, event):
+        # Обработка событий клавиатуры
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_LEFT:
+                self.piece.move(-1, 0)  # Движение влево
+            elif event.key == pygame.K_RIGHT:
+                self.piece.move(1, 0)  # Движение вправо
+            elif event.key == pygame.K_DOWN:
+                self.piece.move(0, 1)  # Ускорение падения
+            elif event.key == pygame.K_UP:
+                self.piece.rotate()  # Поворот фигуры
+
+    def update(self):
+        # Обновление состояния игры
+        if not self.game_over:
+            self.drop_time += 1
+            if self.drop_time >= 30:  # Каждые 30 кадров фигура падает на одну клетку
+                self.drop_time = 0
+                if not self.piece.move(0, 1):  # Если фигура не может падать дальше
+                    self.lock_piece()
+
+    def draw(self):
+        # Отрисовка игры; возвращает список изменившихся областей для pygame.display.update
+        piece_rect = self.piece.rect()
+        if self.board.changed or self.last_piece_rect is None:
+            # Поле изменилось: полная перерисовка
+            self.screen.fill((0, 0, 0))  # Очистка экрана
+            self.board.draw(self.screen)  # Отрисовка игрового поля
+            dirty = [self.screen.get_rect()]
+        elif self.game_over or (piece_rect == self.last_piece_rect and self.piece.state is self.last_state):
+            return []  # Ничего не изменилось
+        else:
+            # Восстановление поля под старым и новым положением фигуры
+            dirty = [self.last_piece_rect, piece_rect]
+            for rect in dirty:
+                self.board.draw(self.screen, rect)
+        self.piece.draw(self.screen)  # Отрисовка текущей фигуры
+        self.last_piece_rect = piece_rect
+        self.last_state = self.piece.state
+        if self.game_over:
+            # Отрисовка сообщения об окончании игры
+            font = text_cache.font(None, 74)  # Шрифт и текст создаются один раз и берутся из кэша
+            text = text_cache.render(font, "Game Over", (255, 0, 0))
+            self.screen.blit(text, (50, 250))
+        return dirty
+
+
+# Общая отрисовка поля: зафиксированные ячейки рисуются на отдельную поверхность,
+# которая перерисовывается только после изменения поля (флаг changed)
+class BoardLayer:
+    changed = True  # Поле изменилось с момента последней отрисовки слоя
+    layer = None  # Закэшированная поверхность с зафиксированными ячейками
+
+    def draw(self, screen, area=None):
+        # Вывод слоя поля на экран целиком или только области area
+        if self.changed or self.layer is None:
+            if self.layer is None:
+                self.layer = pygame.Surface((self.width * 30, self.height * 30))
+                if pygame.display.get_surface() is not None:
+                    self.layer = self.layer.convert()  # Формат экрана ускоряет вывод
+            self.layer.fill((0, 0, 0))
+            self.render(self.layer)
+            self.changed = False
+        if area is None:
+            screen.blit(self.layer, (0, 0))
+        else:
+            screen.blit(self.layer, area, area)
+
+
+# Класс для игрового поля
+class Board(BoardLayer):
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.grid = [[0 for _ in range(width)] for _ in range(height)]  # Инициализация сетки поля
+
+    def place_piece(self, piece):
+        # Размещение фигуры на поле
+        for x, y in piece.shape_coords():
+            self.grid[y][x] = 1  # Заполнение ячеек фигуры в сетке
+        self.changed = True
+        return self.clear_lines()  # Очистка заполненных линий
+
+    def clear_lines(self):
+        # Очистка заполненных линий; возвращает количество очищенных линий
+        new_grid = [row for row in self.grid if any(cell == 0 for cell in row)]  # Оставить только незаполненные линии
+        new_lines = self.height - len(new_grid)  # Количество очищенных линий
+        self.grid = [[0] * self.width for _ in range(new_lines)] + new_grid  # Добавить новые пустые линии сверху
+        return new_lines
+
+    def is_valid_position(self, shape_coords):
+        # Проверка, может ли фигура быть размещена в текущей позиции
+        for x, y in shape_coords:
+            if x < 0 or x >= self.width or y >= self.height:
+                return False  # Выход за границы поля
+            if self.grid[y][x] != 0:
+                return False  # Столкновение с другой фигурой
+        return True
+
+    def fits(self, piece):
+        # Проверка текущей позиции фигуры (общий интерфейс для Board и BitBoard)
+        px, py = piece.x, piece.y
+        for dx, dy in piece.state.cells:
+            x, y = px + dx, py + dy
+            if x < 0 or x >= self.width or y >= self.height:
+                return False  # Выход за границы поля
+            if self.grid[y][x] != 0:
+                return False  # Столкновение с другой фигурой
+        return True
+
+    def render(self, surface):
+        # Отрисовка зафиксированных ячеек на слой поля
+        for y, row in enumerate(self.grid):
+            for x, cell in enumerate(row):
+                if cell:
+                    pygame.draw.rect(surface, (255, 255, 255), (x*30, y*30, 30, 30))  # Отрисовка заполненных ячеек
+
+
+# Игровое поле на битовых масках: каждая строка хранится как целое число,
+# бит x которого соответствует столбцу x. Интерфейс совпадает с Board.
+class BitBoard(BoardLayer):
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.full_row = (1 << width) - 1  # Маска полностью заполненной строки
+        self.rows = [0] * height  # Строки поля сверху вниз
+
+    @property
+    def grid(self):
+        # Представление поля в виде списка списков (для совместимости с Board)
+        return [[(row >> x) & 1 for x in range(self.width)] for row in self.rows]
+
+    def place_piece(self, piece):
+        # Размещение фигуры на поле: объединение строк поля с масками фигуры
+        rows = self.rows
+        for dy, mask in enumerate(piece.state.masks):
+            rows[piece.y + dy] |= mask << piece.x
+        self.changed = True
+        return self.clear_lines()  # Очистка заполненных линий
+
+    def clear_lines(self):
+        # Очистка заполненных линий: заполненная строка равна константе full_row
+        if self.full_row not in self.rows:
+            return 0
+        new_rows = [row for row in self.rows if row != self.full_row]
+        new_lines = self.height - len(new_rows)  # Количество очищенных линий
+        self.rows = [0] * new_lines + new_rows
+        return new_lines
+
+    def is_valid_position(self, shape_coords):
+        # Проверка, может ли фигура быть размещена в текущей позиции
+        rows = self.rows
+        for x, y in shape_coords:
+            if x < 0 or x >= self.width or y >= self.height:
+                return False  # Выход за границы поля
+            if y >= 0 and (rows[y] >> x) & 1:
+                return False  # Столкновение с другой фигурой
+        return True
+
+    def fits(self, piece):
+        # Проверка позиции фигуры сдвигом и побитовым И масок строк
+        x, y = piece.x, piece.y
+        state = piece.state
+        if x < 0 or x + state.width > self.width or y + state.height > self.height:
+            return False  # Выход за границы поля
+        rows = self.rows
+        for dy, mask in enumerate(state.masks):
+            if y + dy >= 0 and rows[y + dy] & (mask << x):
+                return False  # Столкновение с другой фигурой
+        return True
+
+    def render(self, surface):
+        # Отрисовка зафиксированных ячеек на слой поля
+        for y, row in enumerate(self.rows):
+            x = 0
+            while row:
+                if row & 1:
+                    pygame.draw.rect(surface, (255, 255, 255), (x*30, y*30, 30, 30))  # Отрисовка заполненных ячеек
+                row >>= 1
+                x += 1
+
+
+# Класс для управления фигурами
+SHAPES = [
+    [[1, 1, 1], [0, 1, 0]],  # T-shape
+    [[0, 1, 1], [1, 1, 0]],  # S-shape
+    [[1, 1, 0], [0, 1, 1]],  # Z-shape
+    [[1, 1, 1, 1]],          # I-shape
+    [[1, 1], [1, 1]],        # O-shape
+    [[1, 1, 1], [1, 0, 0]],  # L-shape
+    [[1, 1, 1], [0, 0, 1]]   # J-shape
+]
+
+
+# Состояние поворота фигуры: неизменяемые смещения ячеек, маски строк для BitBoard
+# и габариты. Все состояния вычисляются один раз при импорте модуля
+PieceState = namedtuple("PieceState", ["shape", "cells", "masks", "width", "height"])
+
+
+def _make_state(shape):
+    # Построение состояния поворота по форме фигуры
+    shape = tuple(tuple(row) for row in shape)
+    cells = tuple((x, y) for y, row in enumerate(shape) for x, cell in enumerate(row) if cell)
+    masks = tuple(sum(1 << x for x, cell in enumerate(row) if cell) for row in shape)
+    return PieceState(shape, cells, masks, len(shape[0]), len(shape))
+
+
+def _make_rotations(shape):
+    # Все различные повороты фигуры по часовой стрелке; индекс поворота берется по модулю их числа
+    states = [_make_state(shape)]
+    while True:
+        rotated = _make_state(zip(*states[-1].shape[::-1]))
+        if rotated == states[0]:
+            return tuple(states)
+        states.append(rotated)
+
+
+ROTATIONS = tuple(_make_rotations(shape) for shape in SHAPES)  # ROTATIONS[shape_id][rotation]
+
+
+class Piece:
+    def __init__(self, board, shape_id=None):
+        self.board = board
+        if shape_id is None:
+            shape_id = random.randrange(len(SHAPES))  # Случайный выбор формы фигуры
+        self.shape_id = shape_id
+        self.rotation = 0
+        self.states = ROTATIONS[shape_id]  # Таблица поворотов этой фигуры
+        self.state = self.states[0]  # Текущее состояние поворота
+        self.x = board.width // 2 - self.state.width // 2  # Начальная позиция фигуры
+        self.y = 0
+
+    @property
+    def shape(self):
+        return self.state.shape
+
+    @property
+    def masks(self):
+        return self.state.masks
+
+    @property
+    def width(self):
+        return self.state.width
+
+    def shape_coords(self):
+        # Получение координат ячеек фигуры на игровом поле
+        x, y = self.x, self.y
+        return [(x + dx, y + dy) for dx, dy in self.state.cells]
+
+    def move(self, dx, dy):
+        # Перемещение фигуры
+        self.x += dx
+        self.y += dy
+        if not self.board.fits(self):
+            self.x -= dx  # Отмена перемещения при недопустимой позиции
+            self.y -= dy
+            return False
+        return True
+
+    def rotate(self):
+        # Поворот фигуры: переход к следующему состоянию из таблицы поворотов
+        previous = self.rotation
+        self.set_rotation((previous + 1) % len(self.states))
+        if not self.board.fits(self):
+            self.set_rotation(previous)  # Отмена поворота при недопустимой позиции
+            return False
+        return True
+
+    def set_rotation(self, rotation):
+        # Установка состояния поворота по индексу из таблицы
+        self.rotation = rotation
+        self.state = self.states[rotation]
+
+    def rect(self):
+        # Область экрана, занимаемая фигурой
+        return pygame.Rect(self.x * 30, self.y * 30, self.state.width * 30, self.state.height * 30)
+
+    def draw(self, screen):
+        # Отрисовка фигуры
+        for dx, dy in self.state.cells:
+            pygame.draw.rect(screen, (255, 255, 255), ((self.x + dx)*30, (self.y + dy)*30, 30, 30))  # Отрисовка ячеек фигуры
+
+
+# Микробенчмарк реализаций игрового поля: одинаковая последовательность
+# фигур сбрасывается до упора и фиксируется на Board и на BitBoard
+def benchmark_boards(placements=20000, seed=0):
+    results = {}
+    for board_cls in (Board, BitBoard):
+        random.seed(seed)  # Одинаковая последовательность фигур для обеих реализаций
+        board = board_cls(10, 20)
+        checks = 0
+        start = time.perf_counter()
+        for _ in range(placements):
+            piece = Piece(board)
+            for _ in range(random.randrange(4)):
+                piece.rotate()
+            piece.move(random.randint(-5, 5), 0)
+            while piece.move(0, 1):  # Сброс фигуры до упора
+                checks += 1
+            if board.fits(piece):
+                board.place_piece(piece)
+            else:
+                board = board_cls(10, 20)  # Поле переполнено: начинаем заново
+        elapsed = time.perf_counter() - start
+        results[board_cls.__name__] = elapsed
+        print(f"{board_cls.__name__:>8}: {placements} фигур, {checks} проверок, "
+              f"{elapsed:.3f} с, {placements / elapsed:,.0f} фигур/с")
+    print(f"Ускорение BitBoard: {results['Board'] / results['BitBoard']:.2f}x")
+    return results
+
+
+# Стратегии для симуляции без окна: функция получает Game и возвращает
+# целевой (индекс поворота, x) для текущей фигуры, а при необходимости
+# и третий элемент - путь из ходов (см. play_move)
+def random_policy(game):
+    # Случайный поворот и случайная позиция по горизонтали
+    piece = game.piece
+    rotation = game.policy_rng.randrange(len(piece.states))
+    return rotation, game.policy_rng.randint(0, game.board.width - piece.states[rotation].width)
+
+
+def lowest_policy(game):
+    # Жадная стратегия: позиция, в которой фигура опускается ниже всего
+    board, piece = game.board, game.piece
+    probe = Piece(board, piece.shape_id)
+    best, best_y = (0, piece.x), -1
+    for rotation, state in enumerate(piece.states):
+        probe.set_rotation(rotation)
+        for x in range(board.width - state.width + 1):
+            probe.x, probe.y = x, 0
+            if not board.fits(probe):
+                continue
+            while probe.move(0, 1):
+                pass
+            if probe.y + state.height > best_y:
+                best, best_y = (rotation, x), probe.y + state.height
+    return best
+
+
+MOVES = {"<": (-1, 0), ">": (1, 0), "v": (0, 1)}  # Ходы пути: "^" - поворот, остальные - сдвиги
+
+
+def play_move(game, rotation, x, path=None):
+    # Доведение текущей фигуры до цели теми же шагами, что и с клавиатуры:
+    # повороты, сдвиги, затем сброс до упора и фиксация. Возвращает число шагов падения.
+    # Если задан путь ("^", "<", ">", "v"), фигура проходит его, а затем сбрасывается
+    piece = game.piece
+    ticks = 1
+    if path is not None:
+        for step in path:
+            if step == "^":
+                piece.rotate()
+            elif piece.move(*MOVES[step]) and step == "v":
+                ticks += 1
+        while piece.move(0, 1):
+            ticks += 1
+        game.lock_piece()
+        return ticks
+    for _ in range(len(piece.states)):
+        if piece.rotation == rotation % len(piece.states) or not piece.rotate():
+            break
+    while piece.x < x and piece.move(1, 0):
+        pass
+    while piece.x > x and piece.move(-1, 0):
+        pass
+    while piece.move(0, 1):
+        ticks += 1
+    game.lock_piece()
+    return ticks
+
+
+def simulate_game(seed, policy=random_policy, max_pieces=None, board_cls=None):
+    # Одна игра без окна и без ограничения частоты кадров. Фигуры зависят только от seed,
+    # поэтому разные стратегии играют одинаковыми последовательностями фигур
+    game = Game(None, board_cls or BitBoard, random.Random(seed), random.Random(f"policy{seed}"))
+    ticks = 0  # Длительность игры в шагах падения (каждый шаг - 30 кадров в обычной игре)
+    while not game.game_over and (max_pieces is None or game.pieces < max_pieces):
+        ticks += play_move(game, *policy(game))
+    return {"seed": seed, "lines": game.lines, "pieces": game.pieces, "ticks": ticks}
+
+
+def run_simulations(games, policy=random_policy, seed=0, workers=None, max_pieces=None, board_cls=None):
+    # Запуск games игр на всех ядрах процессора и сбор общей статистики
+    run_one = partial(simulate_game, policy=policy, max_pieces=max_pieces, board_cls=board_cls)
+    seeds = range(seed, seed + games)
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run_one, seeds, chunksize=max(1, games // (workers * 4))))
+    elapsed = time.perf_counter() - start
+    pieces = sum(result["pieces"] for result in results)
+    return {
+        "games": games,
+        "workers": workers,
+        "lines": sum(result["lines"] for result in results),
+        "pieces": pieces,
+        "mean_lines": sum(result["lines"] for result in results) / games,
+        "mean_pieces": pieces / games,
+        "mean_ticks": sum(result["ticks"] for result in results) / games,
+        "max_ticks": max(result["ticks"] for result in results),
+        "elapsed": elapsed,
+        "games_per_sec": games / elapsed,
+        "pieces_per_sec": pieces / elapsed,
+    }
+
+
+# ИИ: перебор всех достижимых конечных положений фигуры и их оценка.
+# Поиск работает с полем как с кортежем битовых масок строк (как в BitBoard)
+def board_rows(board):
+    # Строки поля в виде кортежа битовых масок для любой реализации поля
+    if hasattr(board, "rows"):
+        return tuple(board.rows)
+    return tuple(sum(1 << x for x, cell in enumerate(row) if cell) for row in board.grid)
+
+
+def _fits(rows, width, height, state, x, y):
+    # Проверка положения фигуры на поле из битовых масок
+    if x < 0 or x + state.width > width or y + state.height > height:
+        return False
+    for dy, mask in enumerate(state.masks):
+        if rows[y + dy] & (mask << x):
+            return False
+    return True
+
+
+def _place(rows, width, state, x, y):
+    # Поле после фиксации фигуры: (новые строки, количество очищенных линий)
+    rows = list(rows)
+    for dy, mask in enumerate(state.masks):
+        rows[y + dy] |= mask << x
+    full_row = (1 << width) - 1
+    if full_row not in rows:
+        return tuple(rows), 0
+    kept = [row for row in rows if row != full_row]
+    lines = len(rows) - len(kept)
+    return (0,) * lines + tuple(kept), lines
+
+
+def reachable_placements(rows, width, states, spawn_x):
+    # Все конечные положения (поворот, x, y, путь), достижимые из точки появления
+    # поворотами, сдвигами и шагами вниз. Над верхней занятой строкой поле пустое,
+    # поэтому все повороты и сдвиги там допустимы и поиск в ширину начинается
+    # сразу у поверхности стопки
+    height = len(rows)
+    top = next((y for y, row in enumerate(rows) if row), height)
+    count = len(states)
+    if top >= 4:
+        hover = top - 4  # Строка, где любая фигура еще полностью в пустой области
+        frontier = []
+        for rotation, state in enumerate(states):
+            for x in range(width - state.width + 1):
+                shift = x - spawn_x
+                path = "^" * rotation + (">" * shift if shift > 0 else "<" * -shift) + "v" * hover
+                frontier.append((rotation, x, hover, path))
+    elif _fits(rows, width, height, states[0], spawn_x, 0):
+        frontier = [(0, spawn_x, 0, "")]
+    else:
+        return []
+    seen = {(rotation, x, y) for rotation, x, y, _ in frontier}
+    placements = []
+    for rotation, x, y, path in frontier:  # Список пополняется по ходу обхода
+        state = states[rotation]
+        if not _fits(rows, width, height, state, x, y + 1):
+            placements.append((rotation, x, y, path))
+        for step, next_rotation, next_x, next_y in (
+            ("v", rotation, x, y + 1),
+            ("<", rotation, x - 1, y),
+            (">", rotation, x + 1, y),
+            ("^", (rotation + 1) % count, x, y),
+        ):
+            key = (next_rotation, next_x, next_y)
+            if key not in seen and _fits(rows, width, height, states[next_rotation], next_x, next_y):
+                seen.add(key)
+                frontier.append((next_rotation, next_x, next_y, path + step))
+    return placements
+
+
+AI_MAX_PIECES = 500  # Ограничение количества фигур в симуляции с ИИ по умолчанию
+
+
+class PlacementSearch:
+    # Веса эвристики по умолчанию: линии поощряются, высота, дыры и неровность штрафуются
+    WEIGHTS = {"lines": 0.76, "aggregate_height": -0.51, "holes": -0.36, "bumpiness": -0.18}
+
+    def __init__(self, weights=None, lookahead=True, cache_size=100000):
+        self.weights = dict(self.WEIGHTS, **(weights or {}))
+        self.lookahead = lookahead  # Учитывать следующую фигуру (Game.next_piece)
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # LRU-кэш оценок: строки поля -> оценка
+        self.hits = 0
+        self.misses = 0
+
+    def evaluate(self, rows, width):
+        # Оценка поля шириной width без учета очищенных линий, с кэшированием по строкам поля
+        score = self.cache.get(rows)
+        if score is not None:
+            self.cache.move_to_end(rows)
+            self.hits += 1
+            return score
+        self.misses += 1
+        height = len(rows)
+        heights = {}
+        holes = 0
+        covered = 0  # Столбцы, над которыми уже есть занятая ячейка
+        for y, row in enumerate(rows):
+            holes += (covered & ~row).bit_count()
+            new = row & ~covered
+            while new:
+                low = new & -new
+                heights[low.bit_length() - 1] = height - y
+                new ^= low
+            covered |= row
+        columns = [heights.get(x, 0) for x in range(width)]
+        bumpiness = sum(abs(a - b) for a, b in zip(columns, columns[1:]))
+        weights = self.weights
+        score = (weights["aggregate_height"] * sum(columns) + weights["holes"] * holes
+                 + weights["bumpiness"] * bumpiness)
+        self.cache[rows] = score
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)  # Удаление давно не использованной оценки
+        return score
+
+    def best_placement(self, rows, width, piece, next_piece=None):
+        # Лучшее положение текущей фигуры: (оценка, поворот, x, путь)
+        best = None
+        line_weight = self.weights["lines"]
+        for rotation, x, y, path in reachable_placements(rows, width, piece.states, piece.x):
+            after, lines = _place(rows, width, piece.states[rotation], x, y)
+            if next_piece is None:
+                score = self.evaluate(after, width)
+            else:
+                follow = self.best_placement(after, width, next_piece)
+                score = follow[0] if follow else float("-inf")
+            score += line_weight * lines
+            if best is None or score > best[0]:
+                best = (score, rotation, x, path)
+        return best
+
+    def __call__(self, game):
+        # Стратегия для simulate_game: (поворот, x, путь) для текущей фигуры
+        next_piece = game.next_piece if self.lookahead else None
+        best = self.best_placement(board_rows(game.board), game.board.width, game.piece, next_piece)
+        if best is None:
+            return game.piece.rotation, game.piece.x  # Ходов нет: фигура просто падает
+        return best[1:]
+
+
+def benchmark_search(searches=300, seed=0, lookahead=True):
+    # Скорость поиска на позициях из реальной игры ИИ против самого себя
+    search = PlacementSearch(lookahead=lookahead)
+    game = Game(None, BitBoard, random.Random(seed))
+    times = []
+    while len(times) < searches:
+        if game.game_over:
+            game = Game(None, BitBoard, game.rng)
+        start = time.perf_counter()
+        move = search(game)
+        times.append(time.perf_counter() - start)
+        play_move(game, *move)
+    times.sort()
+    total = sum(times)
+    print(f"Поиск {'на две фигуры' if lookahead else 'на одну фигуру'}: {searches} поисков, "
+          f"{searches / total:,.1f} поисков/с")
+    print(f"Время поиска: среднее {total / searches * 1000:.2f} мс, "
+          f"p99 {times[int(searches * 0.99) - 1] * 1000:.2f} мс, макс. {times[-1] * 1000:.2f} мс "
+          f"(кадр 30 FPS - 33.3 мс)")
+    print(f"Кэш оценок: {search.hits} попаданий, {search.misses} промахов, "
+          f"{search.hits / max(1, search.hits + search.misses):.1%}")
+    return searches / total
+
+
+# Основной блок для запуска игры
+# Основной игровой цикл; завершается при закрытии окна или клавишей Esc
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((300, 600))  # Установка размера окна
+    pygame.display.set_caption("Tetris")  # Заголовок окна
+    clock = pygame.time.Clock()  # Создание объекта Clock для управления FPS
+    game = Game(screen)  # Создание объекта Game
+    profiler = frame_stats.profiler  # Замер времени фаз кадра (оверлей - клавиша F3)
+
+    while True:
+        # Основной игровой цикл
+        profiler.frame()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                return  # Выход из игры (окно остается открытым для лаунчера)
+            if profiler.handle_event(event):
+                game.last_piece_rect = None  # Оверлей показан или скрыт: полная перерисовка
+                continue
+            game.handle_event(event)  # Обработка событий
+        profiler.mark("events")
+
+        game.update()  # Обновление состояния игры
+        profiler.mark("update")
+        dirty = game.draw()  # Отрисовка игры; список изменившихся областей
+        overlay = profiler.draw_overlay(screen)
+        if overlay is not None:
+            dirty.append(overlay)
+        profiler.mark("draw")
+        pygame.display.update(dirty)  # Обновление только изменившихся областей
+        profiler.mark("flip")
+        clock.tick(30)  # Установка FPS
+
+
+# Запуск из командной строки: игра или режимы bench, bench-ai, simulate
+def cli():
+    if sys.argv[1:2] == ["bench"]:
+        benchmark_boards()
+    elif sys.argv[1:2] == ["bench-ai"]:
+        benchmark_search(lookahead=False)
+        benchmark_search()
+    elif sys.argv[1:2] == ["simulate"]:
+        # Пример: python "Game Tetris.py" simulate 10000 lowest
+        # Четвертый аргумент - ограничение количества фигур в игре; ИИ почти не проигрывает,
+        # поэтому для него ограничение по умолчанию AI_MAX_PIECES
+        policies = {"random": random_policy, "lowest": lowest_policy, "ai": PlacementSearch()}
+        games = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+        name = sys.argv[3] if len(sys.argv) > 3 else "lowest"
+        max_pieces = int(sys.argv[4]) if len(sys.argv) > 4 else (AI_MAX_PIECES if name == "ai" else None)
+        for key, value in run_simulations(games, policies[name], max_pieces=max_pieces).items():
+            print(f"{key:>15}: {value:,.2f}" if isinstance(value, float) else f"{key:>15}: {value}")
+    else:
+        main()
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,58 @@
+import pygame
+from collections import OrderedDict
+
+
+# Общий кэш отрисовки текста для всех игр: реестр шрифтов и LRU-кэш готовых
+# поверхностей с текстом. Растеризация шрифта - одна из самых дорогих операций
+# игрового цикла, поэтому неизменный текст отрисовывается только один раз
+class TextCache:
+    def __init__(self, max_surfaces=256):
+        self.max_surfaces = max_surfaces
+        self.fonts = {}  # (имя, размер, системный шрифт) -> pygame.font.Font
+        self.surfaces = OrderedDict()  # (шрифт, текст, цвет, сглаживание) -> поверхность
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, name=None, size=36, sysfont=False):
+        # Шрифт из реестра; создается при первом обращении
+        key = (name, size, sysfont)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.SysFont(name, size) if sysfont else pygame.font.Font(name, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, font, text, color, antialias=True):
+        # Поверхность с текстом; повторная отрисовка того же текста берется из кэша
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)  # Удаление давно не использованного текста
+        return surface
+
+    def stats(self):
+        # Статистика кэша: попадания, промахи, доля попаданий и размер
+        requests = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / requests if requests else 0.0,
+                "surfaces": len(self.surfaces), "fonts": len(self.fonts)}
+
+    def clear(self):
+        # Очистка кэша (например, после pygame.quit(), когда шрифты становятся недействительными)
+        self.fonts.clear()
+        self.surfaces.clear()
+
+
+# Общий экземпляр, который используют все игры
+cache = TextCache()
+font = cache.font
+render = cache.render
+stats = cache.stats